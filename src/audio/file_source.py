@@ -2,9 +2,24 @@ import numpy as np
 import scipy.io.wavfile as wav
 from scipy import signal
 import os
+import hashlib
+from fractions import Fraction
+from pathlib import Path
 from .base import AudioSource
 from ..config import SAMPLE_RATE, CHUNK_SIZE
 
+# Resampled copies of WAV files whose rate differs from SAMPLE_RATE, so the
+# (slow on a Pi) resample only happens the first time a file is played
+CACHE_DIR = Path.home() / '.cache' / 'audioviz'
+
+# (offset, scale) mapping each WAV sample type onto float32 -1.0 to 1.0,
+# applied as (sample - offset) * scale
+SAMPLE_SCALING = {
+    np.dtype(np.int16): (0.0, np.float32(1.0 / 32768.0)),
+    np.dtype(np.int32): (0.0, np.float32(1.0 / 2147483648.0)),
+    np.dtype(np.uint8): (128.0, np.float32(1.0 / 128.0)),
+}
+
 class FileAudioSource(AudioSource):
     """
     Audio source that reads from a file (WAV).
@@ -13,8 +28,14 @@ class FileAudioSource(AudioSource):
         self.file_path = file_path
         self.loop = loop
         self.cursor = 0
+        # Raw samples: for WAVs already at SAMPLE_RATE this is a memory map of the
+        # file in its stored format (int16, mono, ...), and read_chunk converts
+        # only the frames it returns. The OS pages the file in and out, so even
+        # long files keep a small resident footprint.
         self.data = None
         self.fs = 0
+        # Float32 stereo output of read_chunk, reused so reads don't allocate
+        self._out = np.empty((CHUNK_SIZE, 2), dtype=np.float32)
         self._load_file()
 
     def _load_file(self):
@@ -22,38 +43,102 @@ class FileAudioSource(AudioSource):
              # Create a silent buffer if file not found to avoid crash during dev
              print(f"Warning: Audio file not found at {self.file_path}. Using silence.")
              self.fs = SAMPLE_RATE
-             self.data = np.zeros((SAMPLE_RATE * 5, 2), dtype=np.float32)
+             self._set_data(np.zeros((SAMPLE_RATE * 5, 2), dtype=np.float32))
              return
 
         try:
-            self.fs, data = wav.read(self.file_path)
-            
-            # Convert to float32 -1.0 to 1.0
-            if data.dtype == np.int16:
-                data = data.astype(np.float32) / 32768.0
-            elif data.dtype == np.int32:
-                 data = data.astype(np.float32) / 2147483648.0
-            elif data.dtype == np.uint8:
-                data = (data.astype(np.float32) - 128.0) / 128.0
+            cache_path = self._cache_path()
+            cached = self._load_cache(cache_path)
+            if cached is not None:
+                self._set_data(cached)
+                self.fs = SAMPLE_RATE
+                print(f"Loaded audio file: {self.file_path} ({len(self.data)/self.fs:.2f}s, cached resample)")
+                return
             
-            # Handle channels
-            if len(data.shape) == 1:
-                # Mono to Stereo
-                data = np.stack((data, data), axis=1)
+            try:
+                self.fs, data = wav.read(self.file_path, mmap=True)
+            except ValueError:
+                # Some encodings (e.g. 24-bit PCM) can't be memory mapped
+                self.fs, data = wav.read(self.file_path)
             
             # Resample if necessary
             if self.fs != SAMPLE_RATE:
                 print(f"Resampling from {self.fs} to {SAMPLE_RATE} Hz...")
-                num_samples = int(len(data) * SAMPLE_RATE / self.fs)
-                data = signal.resample(data, num_samples)
+                # Resampling needs the whole signal decoded to float32 -1.0 to 1.0.
+                # Same scaling as read_chunk: one cast, then in-place multiplies by
+                # a precomputed reciprocal (division is far slower on ARM).
+                if data.dtype in SAMPLE_SCALING:
+                    offset, scale = SAMPLE_SCALING[data.dtype]
+                    data = data.astype(np.float32)
+                    if offset:
+                        np.subtract(data, np.float32(offset), out=data)
+                    np.multiply(data, scale, out=data)
+                
+                # Polyphase filtering is O(N * taps) and, unlike the FFT-based
+                # signal.resample, doesn't crawl when the file length has large
+                # prime factors. Common rates reduce to small ratios (48k/44.1k = 160/147).
+                ratio = Fraction(SAMPLE_RATE, self.fs).limit_denominator(1000)
+                data = signal.resample_poly(data, ratio.numerator, ratio.denominator, axis=0)
+                data = data.astype(np.float32, copy=False)
                 self.fs = SAMPLE_RATE
+                self._save_cache(cache_path, data)
                 
-            self.data = data
+            self._set_data(data)
             print(f"Loaded audio file: {self.file_path} ({len(self.data)/self.fs:.2f}s)")
             
         except Exception as e:
             print(f"Error loading audio file: {e}")
-            self.data = np.zeros((SAMPLE_RATE * 5, 2), dtype=np.float32)
+            self._set_data(np.zeros((SAMPLE_RATE * 5, 2), dtype=np.float32))
+
+    def _cache_path(self) -> Path:
+        """Cache file for this WAV, keyed so edits or a new SAMPLE_RATE miss."""
+        path = os.path.abspath(self.file_path)
+        mtime = os.path.getmtime(path)
+        key = hashlib.md5(f"{path}|{mtime}|{SAMPLE_RATE}".encode()).hexdigest()
+        return CACHE_DIR / f"{key}.npy"
+
+    def _load_cache(self, cache_path: Path):
+        if not cache_path.exists():
+            return None
+        try:
+            return np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            # Unreadable cache entry: fall back to decoding and resampling again
+            print(f"Warning: Ignoring unreadable resample cache {cache_path}: {e}")
+            return None
+
+    def _set_data(self, data: np.ndarray):
+        """Store raw samples and pick the per-chunk conversion for their type."""
+        self.data = data
+        self._offset, self._scale = SAMPLE_SCALING.get(data.dtype, (0.0, None))
+
+    def _convert(self, frames: np.ndarray, dest: np.ndarray):
+        """Convert raw frames into a float32 stereo slice of the output buffer."""
+        if frames.ndim == 1:
+            # Mono: broadcast the one channel into both output columns
+            frames = frames[:, np.newaxis]
+        frames = frames[:, :2]
+        if self._scale is None:
+            # Already floating point
+            np.copyto(dest, frames, casting='same_kind')
+        elif self._offset:
+            np.subtract(frames, np.float32(self._offset), out=dest, dtype=np.float32)
+            np.multiply(dest, self._scale, out=dest)
+        else:
+            np.multiply(frames, self._scale, out=dest, dtype=np.float32, casting='unsafe')
+
+    def _save_cache(self, cache_path: Path, data: np.ndarray):
+        # Write to a temp file and rename it into place, so an interrupted save
+        # can never leave a truncated .npy that a later run would load
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                np.save(f, data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            # Caching is only an optimization; playback works without it
+            print(f"Warning: Could not cache resampled audio: {e}")
 
     def start(self):
         self.cursor = 0
@@ -62,27 +147,32 @@ class FileAudioSource(AudioSource):
         pass
 
     def read_chunk(self) -> np.ndarray:
+        # Chunks are returned in a reused buffer; callers must copy a chunk if
+        # they need it to survive the next read
         if self.data is None:
-            return np.zeros((CHUNK_SIZE, 2), dtype=np.float32)
+            self._out.fill(0.0)
+            return self._out
             
         end = self.cursor + CHUNK_SIZE
         
         if end > len(self.data):
-            if self.loop:
-                # Wrap around
-                chunk = self.data[self.cursor:]
-                remaining = CHUNK_SIZE - len(chunk)
-                chunk = np.concatenate((chunk, self.data[:remaining]))
-                self.cursor = remaining
-                return chunk
+            tail = len(self.data) - self.cursor
+            self._convert(self.data[self.cursor:], self._out[:tail])
+            if self.loop and len(self.data) > 0:
+                # Wrap around, treating self.data as a circular buffer. Normally
+                # this is one more copy from the start; a file shorter than a
+                # chunk is simply repeated until the chunk is full.
+                filled = tail
+                while filled < CHUNK_SIZE:
+                    n = min(CHUNK_SIZE - filled, len(self.data))
+                    self._convert(self.data[:n], self._out[filled:filled + n])
+                    filled += n
+                self.cursor = n % len(self.data)
             else:
                 # Pad with zeros
-                chunk = self.data[self.cursor:]
-                padding = np.zeros((CHUNK_SIZE - len(chunk), 2), dtype=np.float32)
-                chunk = np.concatenate((chunk, padding))
+                self._out[tail:] = 0.0
                 self.cursor = len(self.data) # Stay at end
-                return chunk
         else:
-            chunk = self.data[self.cursor:end]
+            self._convert(self.data[self.cursor:end], self._out)
             self.cursor = end
-            return chunk
+        return self._out
@@ -1,13 +1,30 @@
+import logging
+import time
 import numpy as np
 import sounddevice as sd
 from .base import AudioSource
 from ..config import SAMPLE_RATE, CHUNK_SIZE
 
+# 1.0 / 2147483648.0 - maps full-scale int32 samples onto [-1.0, 1.0)
+INT32_TO_FLOAT = np.float32(4.656612873077393e-10)
+
+# Capture history kept by the stream callback, in chunks. Several chunks deep so
+# the callback never writes into the window read_chunk is copying out.
+RING_CHUNKS = 4
+
+# Overflows are tallied by the callback and reported at most this often (seconds)
+OVERFLOW_REPORT_INTERVAL = 1.0
+
+logger = logging.getLogger(__name__)
 
 class LiveAudioSource(AudioSource):
     """
     Audio source that captures live audio from a microphone or audio input device.
     Uses sounddevice for cross-platform audio capture.
+    
+    Capture runs in sounddevice's callback thread, which writes into a ring
+    buffer; read_chunk() copies out the most recent chunk without blocking,
+    so the render loop is never stalled waiting on the audio device.
     """
     
     def __init__(self, device=None, channels=2):
@@ -23,22 +40,30 @@ class LiveAudioSource(AudioSource):
         self.channels = channels
         self.stream = None
         self.dtype = 'float32'
+        # Output of read_chunk, reused every call so reads don't allocate
         self.buffer = np.zeros((CHUNK_SIZE, channels), dtype=np.float32)
         
+        # Single producer (callback) / single consumer (read_chunk) ring buffer.
+        # Only the callback advances _write_pos, and it does so after the frames
+        # are in place, so the reader never needs a lock.
+        self._ring = np.zeros((CHUNK_SIZE * RING_CHUNKS, channels), dtype=np.float32)
+        self._write_pos = 0
+        
+        # Overflow tally: the callback only increments it, read_chunk reports it
+        self._overflow_count = 0
+        self._overflow_reported = 0
+        self._last_overflow_report = time.monotonic()
+        
     def start(self):
         """Start the audio input stream."""
-        print(f"Starting live audio capture...")
-        print(f"  Device: {self.device if self.device else 'default'}")
-        print(f"  Sample rate: {SAMPLE_RATE} Hz")
-        print(f"  Channels: {self.channels}")
-        print(f"  Chunk size: {CHUNK_SIZE}")
+        # Startup details are debug-only; run main with --debug to see them
+        logger.debug("Starting live audio capture...")
+        logger.debug("  Device: %s", self.device if self.device else 'default')
+        logger.debug("  Sample rate: %d Hz", SAMPLE_RATE)
+        logger.debug("  Channels: %d", self.channels)
+        logger.debug("  Chunk size: %d", CHUNK_SIZE)
         
         try:
-            # Query device info
-            if self.device is not None:
-                device_info = sd.query_devices(self.device, 'input')
-                print(f"  Device info: {device_info['name']}")
-            
             # Attempt to open the float32 stream (standard microphones)
             try:
                 self.stream = sd.InputStream(
@@ -46,31 +71,34 @@ class LiveAudioSource(AudioSource):
                     channels=self.channels,
                     samplerate=SAMPLE_RATE,
                     blocksize=CHUNK_SIZE,
-                    dtype='float32'
+                    dtype='float32',
+                    callback=self._callback
                 )
                 self.dtype = 'float32'
-                print("  Format: float32 (Native)")
+                logger.debug("  Format: float32 (Native)")
             except Exception as e:
                 # Fallback: Many pure ALSA hardware devices (like PCM1808 via I2S) 
                 # strictly enforce 32-bit integer data and refuse float32 requests.
-                print("  Failed to open float32 stream, attempting 32-bit integer fallback...")
+                logger.debug("  Failed to open float32 stream (%s), attempting 32-bit integer fallback...", e)
                 self.stream = sd.InputStream(
                     device=self.device,
                     channels=self.channels,
                     samplerate=SAMPLE_RATE,
                     blocksize=CHUNK_SIZE,
-                    dtype='int32'
+                    dtype='int32',
+                    callback=self._callback
                 )
                 self.dtype = 'int32'
-                print("  Format: int32 (Will be converted to float32 internally)")
+                logger.debug("  Format: int32 (Will be converted to float32 internally)")
                 
             self.stream.start()
-            print("Live audio stream started successfully!")
+            logger.info("Live audio stream started (%s)", self.device if self.device else 'default device')
             
         except Exception as e:
-            print(f"Error starting audio stream: {e}")
-            print("\nAvailable audio devices:")
-            print(sd.query_devices())
+            # Enumerating devices walks the whole ALSA tree (slow on a Pi), so it
+            # is only done here, to help pick a working --device
+            logger.error("Error starting audio stream: %s", e)
+            logger.error("Available audio devices:\n%s", sd.query_devices())
             raise
     
     def stop(self):
@@ -79,36 +107,72 @@ class LiveAudioSource(AudioSource):
             self.stream.stop()
             self.stream.close()
             self.stream = None
-            print("Audio stream stopped.")
+            logger.debug("Audio stream stopped.")
+    
+    def _store(self, frames_in, dest):
+        """Copy captured frames into a ring slice, converting int32 to float32."""
+        if self.dtype == 'int32':
+            # One fused cast+multiply straight into the ring
+            # (multiplication is generally faster than division on ARM)
+            np.multiply(frames_in, INT32_TO_FLOAT, out=dest, dtype=np.float32, casting='unsafe')
+        else:
+            np.copyto(dest, frames_in)
+    
+    def _callback(self, indata, frames, time_info, status):
+        """sounddevice stream callback: append the new block to the ring buffer."""
+        if status.input_overflow:
+            self._overflow_count += 1
+        
+        ring_len = len(self._ring)
+        pos = self._write_pos % ring_len
+        first = min(frames, ring_len - pos)
+        self._store(indata[:first], self._ring[pos:pos + first])
+        if first < frames:
+            self._store(indata[first:frames], self._ring[:frames - first])
+        
+        # Publish only after the frames are written
+        self._write_pos += frames
+    
+    def _report_overflows(self):
+        """Log overflows counted since the last report, at most once per interval."""
+        now = time.monotonic()
+        if now - self._last_overflow_report < OVERFLOW_REPORT_INTERVAL:
+            return
+        self._last_overflow_report = now
+        
+        # Diff against what was already reported rather than resetting the
+        # counter, so the callback stays the only writer of _overflow_count
+        count = self._overflow_count
+        new = count - self._overflow_reported
+        if new:
+            self._overflow_reported = count
+            logger.warning("Audio buffer overflow detected (%d since last report)", new)
     
     def read_chunk(self) -> np.ndarray:
         """
-        Read a chunk of audio data from the live stream.
+        Read the most recent chunk of audio captured by the stream.
         
         Returns:
-            np.ndarray: Audio data chunk of shape (CHUNK_SIZE, channels)
+            np.ndarray: Audio data chunk of shape (CHUNK_SIZE, channels).
+            The array is reused by the next call; copy it to keep it.
         """
         if self.stream is None:
             return np.zeros((CHUNK_SIZE, self.channels), dtype=np.float32)
         
-        try:
-            # Read from stream
-            data, overflowed = self.stream.read(CHUNK_SIZE)
-            
-            if overflowed:
-                print("Warning: Audio buffer overflow detected!")
-            
-            # Convert raw 32-bit integers to float32 (-1.0 to 1.0) if necessary
-            if self.dtype == 'int32':
-                # Convert to float32 and multiply (multiplication is generally faster than division on ARM)
-                # 1.0 / 2147483648.0 = 4.656612873077393e-10
-                data = data.astype(np.float32) * 4.656612873077393e-10
-            
-            return data
-            
-        except Exception as e:
-            print(f"Error reading audio: {e}")
-            return np.zeros((CHUNK_SIZE, self.channels), dtype=np.float32)
+        self._report_overflows()
+        
+        # Snapshot the write position once; the callback may advance it meanwhile,
+        # but RING_CHUNKS leaves room so it can't overwrite the span copied here.
+        end = self._write_pos % len(self._ring)
+        start = end - CHUNK_SIZE
+        if start >= 0:
+            np.copyto(self.buffer, self._ring[start:end])
+        else:
+            # Latest chunk wraps around the end of the ring
+            self.buffer[:-start] = self._ring[start:]
+            self.buffer[-start:] = self._ring[:end]
+        
+        return self.buffer
 
 
 def list_audio_devices():
@@ -21,6 +21,8 @@ DEFAULTS = {
     },
     'visualization': {
         'fft_size': 2048,
+        'fft_backend': 'auto',
+        'fft_silence_threshold': 1e-4,
         'smoothing_factor': 0.7,
         'max_decay': 0.995,
         'waveform_initial_max': 0.1,
@@ -42,6 +44,7 @@ DEFAULTS = {
         'history_depth': 40,
         'num_bins': 60,
         'vertical_line_step': 3,
+        'vertical_depth_step': 1,
     },
 }
 
@@ -80,6 +83,8 @@ FULLSCREEN = config['display']['fullscreen']
 
 # Visualization Settings
 FFT_SIZE = config['visualization']['fft_size']
+FFT_BACKEND = config['visualization']['fft_backend']
+FFT_SILENCE_THRESHOLD = config['visualization']['fft_silence_threshold']
 SMOOTHING_FACTOR = config['visualization']['smoothing_factor']
 MAX_DECAY = config['visualization']['max_decay']
 WAVEFORM_INITIAL_MAX = config['visualization']['waveform_initial_max']
@@ -101,4 +106,5 @@ MAX_PARTICLES = config['particles']['max_count']
 TERRAIN_HISTORY_DEPTH = config['terrain']['history_depth']
 TERRAIN_NUM_BINS = config['terrain']['num_bins']
 TERRAIN_VERTICAL_LINE_STEP = config['terrain']['vertical_line_step']
+TERRAIN_VERTICAL_DEPTH_STEP = config['terrain']['vertical_depth_step']
 
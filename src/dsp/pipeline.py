@@ -1,15 +1,159 @@
 import numpy as np
 import scipy.fft
-from ..config import SAMPLE_RATE, FFT_SIZE
+from ..config import SAMPLE_RATE, FFT_SIZE, FFT_BACKEND, FFT_SILENCE_THRESHOLD
+
+try:
+    import pyfftw
+except ImportError:
+    # pyFFTW is optional - scipy.fft is used when it isn't installed
+    pyfftw = None
+
+FFT_BACKENDS = ('auto', 'scipy', 'pyfftw', 'cupy')
+
+# Byte alignment for FFT input buffers - enough for any SIMD width pocketfft uses
+SIMD_ALIGNMENT = 64
+
+def _empty_aligned(shape, dtype, alignment=SIMD_ALIGNMENT) -> np.ndarray:
+    """np.empty whose data starts on an `alignment`-byte boundary."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+def _import_cupy():
+    # Only imported when asked for: importing CuPy initializes CUDA, which is
+    # slow and pointless on machines (like the Pi) without an NVIDIA GPU
+    try:
+        import cupy
+        return cupy
+    except ImportError:
+        return None
 
 class DSPPipeline:
     """
     Handles Digital Signal Processing (FFT) for audio data.
+    
+    Args:
+        output_dtype: dtype of the magnitude/phase arrays returned by process().
+            float32 by default; np.float16 halves the data handed to the
+            renderer, which only needs display precision.
+        backend: FFT implementation, one of FFT_BACKENDS. 'auto' uses pyFFTW
+            when installed and scipy.fft otherwise; 'cupy' runs the transform
+            on an NVIDIA GPU and is never picked automatically. Defaults to
+            fft_backend from config.toml.
+        silence_threshold: chunks whose peak amplitude is below this skip the
+            FFT and yield an all-zero spectrum. Defaults to fft_silence_threshold
+            from config.toml; 0 always transforms.
     """
     
-    def __init__(self):
-        self.window = np.hanning(FFT_SIZE)
+    def __init__(self, output_dtype=np.float32, backend=None, silence_threshold=None):
+        # Transform length. pocketfft/FFTW slow down sharply on lengths with large
+        # prime factors, so an unfriendly fft_size from config.toml is rounded up
+        # to the next fast length; frames are zero-padded to it like any short chunk.
+        self._n = scipy.fft.next_fast_len(FFT_SIZE, real=True)
+        if self._n != FFT_SIZE:
+            print(f"Warning: fft_size {FFT_SIZE} is slow to transform, padding frames to {self._n}")
+        
+        # float32 so the windowing multiply doesn't upcast the audio to float64
+        self.window = np.hanning(FFT_SIZE).astype(np.float32)
+        
+        # Internally everything is channel-major (channels, samples): sources hand
+        # over interleaved (N, 2) frames, but each channel's FFT then reads and
+        # writes unit-stride memory instead of striding by 2, and the (2, bins)
+        # outputs are contiguous rows for the renderer's spectrum[ch] accesses.
+        self.silence_threshold = (FFT_SILENCE_THRESHOLD if silence_threshold is None
+                                  else silence_threshold)
+        self.backend = self._select_backend(FFT_BACKEND if backend is None else backend)
+        
+        # The FFT length never changes at runtime, so with pyFFTW plan the
+        # stereo transform once here and just execute it every frame.
+        # FFTW_MEASURE scribbles over the buffers while planning, which is fine
+        # because they are refilled before each execution.
+        self._fft_plan = None
+        if self.backend == 'pyfftw':
+            self._fft_in = pyfftw.empty_aligned((2, self._n), dtype='float32')
+            self._fft_out = pyfftw.empty_aligned((2, self._n // 2 + 1), dtype='complex64')
+            self._fft_plan = pyfftw.FFTW(self._fft_in, self._fft_out, axes=(1,),
+                                         flags=('FFTW_MEASURE',))
+        else:
+            # Windowed (and zero-padded) stereo input, reused every frame
+            self._fft_in = _empty_aligned((2, self._n), np.float32)
+            if self.backend == 'cupy':
+                # Host copy of the GPU result; the renderer draws from host memory
+                self._fft_out = np.empty((2, self._n // 2 + 1), dtype=np.complex64)
+        
+        # Output buffers laid out like the FFT output, so abs/angle/power are
+        # written in place rather than allocating fresh arrays every frame
+        self._mag = np.empty((2, self._n // 2 + 1), dtype=np.float32)
+        self._phase = np.empty((2, self._n // 2 + 1), dtype=np.float32)
+        self._power = np.empty((2, self._n // 2 + 1), dtype=np.float32)
+        
+        # Reduced-precision copies of magnitude/phase for process(). The maths
+        # stays float32 (there are no half-precision FFT kernels here); only the
+        # result is narrowed, once, into buffers that are reused every frame.
+        self.output_dtype = np.dtype(output_dtype)
+        self._mag_out = self._mag
+        self._phase_out = self._phase
+        if self.output_dtype != np.float32:
+            self._mag_out = np.empty(self._mag.shape, dtype=self.output_dtype)
+            self._phase_out = np.empty(self._phase.shape, dtype=self.output_dtype)
+        
+    def _is_silent(self, audio_chunk: np.ndarray) -> bool:
+        """True if the chunk's peak amplitude is below the silence threshold."""
+        if len(audio_chunk) == 0:
+            return True
+        # max/min are plain reductions, so unlike np.max(np.abs(x)) this doesn't
+        # allocate an |x| temporary; still far cheaper than windowing + FFT
+        peak = max(audio_chunk.max(), -audio_chunk.min())
+        return peak < self.silence_threshold
+    
+    def _transform(self, audio_chunk: np.ndarray) -> np.ndarray:
+        """Window and FFT both channels, returning the (2, bins) complex spectrum."""
+        # Keep the hot path in single precision: scipy.fft dispatches to the
+        # float32 pocketfft kernels only when its input is float32, whereas a
+        # float64 chunk (e.g. resampled file audio) doubles the memory traffic.
+        audio_chunk = np.asarray(audio_chunk, dtype=np.float32)
         
+        # Window straight into the preallocated stereo input buffer; the transposed
+        # chunk view makes this multiply the deinterleaving pass too. A mono chunk
+        # (N, 1) broadcasts into both rows, so both channels always go through
+        # one batched transform. Chunks are usually shorter than the FFT length, so
+        # the tail is zeroed in place instead of concatenating padding every frame.
+        n = min(len(audio_chunk), FFT_SIZE)
+        np.multiply(audio_chunk[:n, :2].T, self.window[:n], out=self._fft_in[:, :n])
+        self._fft_in[:, n:] = 0.0
+        
+        if self._fft_plan is not None:
+            return self._fft_plan()
+        if self.backend == 'cupy':
+            # At this size the transfers cost about as much as the FFT saves, so
+            # this only pays off on desktops whose CPU is the bottleneck
+            gpu_result = self._cupy.fft.rfft(self._cupy.asarray(self._fft_in), axis=1)
+            return gpu_result.get(out=self._fft_out)
+        # Perform real FFT along the time axis (axis=1) for all channels at once
+        # scipy.fft is generally faster than numpy.fft, especially when scipy uses BLAS/LAPACK backends
+        # The input is rebuilt every frame, so pocketfft may use it as scratch space
+        return scipy.fft.rfft(self._fft_in, axis=1, overwrite_x=True)
+    
+    def _select_backend(self, backend: str) -> str:
+        """Resolve the requested FFT backend to one that is actually available."""
+        if backend not in FFT_BACKENDS:
+            print(f"Warning: Unknown fft_backend '{backend}', using 'auto'")
+            backend = 'auto'
+        if backend == 'cupy':
+            self._cupy = _import_cupy()
+            if self._cupy is not None:
+                return 'cupy'
+            print("Warning: fft_backend 'cupy' requested but CuPy is not installed, using 'auto'")
+            backend = 'auto'
+        if backend == 'pyfftw' and pyfftw is None:
+            print("Warning: fft_backend 'pyfftw' requested but pyFFTW is not installed, using scipy")
+            return 'scipy'
+        if backend == 'auto':
+            return 'pyfftw' if pyfftw is not None else 'scipy'
+        return backend
+    
     def process(self, audio_chunk: np.ndarray) -> tuple:
         """
         Compute the FFT of the audio chunk for both channels.
@@ -21,31 +165,52 @@ class DSPPipeline:
             tuple: (magnitude, phase) where:
                 - magnitude (np.ndarray): Frequency spectrum magnitude (2, N/2 + 1)
                 - phase (np.ndarray): Frequency spectrum phase (2, N/2 + 1)
+            Both have the pipeline's output_dtype and are views of internal buffers that are overwritten by the next
+            call; copy them to keep them.
         """
-        # Ensure we have enough data, pad if necessary
-        if len(audio_chunk) < FFT_SIZE:
-             padding = np.zeros((FFT_SIZE - len(audio_chunk), audio_chunk.shape[1]), dtype=np.float32)
-             audio_chunk = np.concatenate((audio_chunk, padding))
+        audio_chunk = np.asarray(audio_chunk, dtype=np.float32)
+        if self._is_silent(audio_chunk):
+            # Spectrum of (near) silence is (near) zero: skip the transform
+            self._mag_out.fill(0.0)
+            self._phase_out.fill(0.0)
+            return self._mag_out, self._phase_out
         
-        # Take exactly FFT_SIZE samples
-        data = audio_chunk[:FFT_SIZE, :]
+        fft_result = self._transform(audio_chunk)
         
-        # Apply window to both channels simultaneously using broadcasting
-        # data: (FFT_SIZE, channels), window: (FFT_SIZE,) -> (FFT_SIZE, 1)
-        windowed_data = data * self.window[:, np.newaxis]
+        # Calculate magnitude and phase into the preallocated buffers.
+        # np.angle has no out= parameter, but it is just arctan2(imag, real).
+        np.abs(fft_result, out=self._mag)
+        np.arctan2(fft_result.imag, fft_result.real, out=self._phase)
         
-        # Perform real FFT along the time axis (axis=0) for all channels at once
-        # scipy.fft is generally faster than numpy.fft, especially when scipy uses BLAS/LAPACK backends
-        fft_result = scipy.fft.rfft(windowed_data, axis=0)
+        if self._mag_out is not self._mag:
+            np.copyto(self._mag_out, self._mag, casting='unsafe')
+            np.copyto(self._phase_out, self._phase, casting='unsafe')
+        return self._mag_out, self._phase_out
+    
+    def process_power(self, audio_chunk: np.ndarray) -> np.ndarray:
+        """
+        Compute the power spectrum |X|^2 of the audio chunk for both channels.
         
-        # Calculate magnitude and phase
-        # Result shape: (bins, channels) -> transpose to (channels, bins) to match old API
-        spectrum = np.abs(fft_result).T
-        phase = np.angle(fft_result).T
+        For consumers that work in the log domain (10 * log10(power) is the
+        same dB value as 20 * log10(magnitude)) and don't need phase, this
+        skips the per-bin arctan2 that process() pays for np.angle.
         
-        # Handle mono fallback just in case
-        if spectrum.shape[0] == 1:
-            spectrum = np.vstack((spectrum, spectrum))
-            phase = np.vstack((phase, phase))
+        Args:
+            audio_chunk (np.ndarray): Input audio data (N, 2).
             
-        return spectrum, phase
+        Returns:
+            np.ndarray: Power spectrum (2, N/2 + 1). Always float32, since loud
+            bins overflow float16. This is a view of an internal buffer that is
+            overwritten by the next call; copy it to keep it.
+        """
+        audio_chunk = np.asarray(audio_chunk, dtype=np.float32)
+        if self._is_silent(audio_chunk):
+            self._power.fill(0.0)
+            return self._power
+        
+        fft_result = self._transform(audio_chunk)
+        # NumPy's SIMD |z| beats re^2 + im^2 over the strided real/imag views,
+        # so square the magnitude in place rather than recombining components
+        np.abs(fft_result, out=self._power)
+        np.square(self._power, out=self._power)
+        return self._power
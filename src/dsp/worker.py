@@ -0,0 +1,90 @@
+import queue
+import threading
+import numpy as np
+from .pipeline import DSPPipeline
+
+# Frames that may be waiting for the renderer. Small so the display never lags
+# far behind the audio; a full queue also paces the worker to the render rate.
+FRAME_QUEUE_SIZE = 2
+
+# Frame buffers the worker rotates through: every queued frame, the one the
+# renderer is drawing and the one being filled are distinct slots
+FRAME_POOL_SIZE = FRAME_QUEUE_SIZE + 2
+
+class DSPWorker(threading.Thread):
+    """
+    Background thread that reads audio chunks and runs the FFT on them.
+
+    Moves acquisition and DSP off the render thread, so reading the next chunk
+    and transforming it overlaps with drawing the current frame.
+    Frames are handed over through a bounded queue as
+    (magnitude, audio_chunk, phase) tuples whose arrays come from a small
+    pool of preallocated slots, so steady-state frames allocate nothing.
+    """
+
+    def __init__(self, audio, dsp: DSPPipeline = None):
+        super().__init__(name="DSPWorker", daemon=True)
+        self.audio = audio
+        self.dsp = dsp if dsp is not None else DSPPipeline()
+        self.frames = queue.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self.error = None
+        self._stop_event = threading.Event()
+        self._pool = [None] * FRAME_POOL_SIZE
+        self._slot = 0
+
+    def run(self):
+        try:
+            while not self._stop_event.is_set():
+                data = self.audio.read_chunk()
+                magnitude, phase = self.dsp.process(data)
+                # Sources and the pipeline reuse their output buffers, so the
+                # frame gets its own copies before it crosses to the render thread
+                self._put(self._fill_slot(magnitude, data, phase))
+        except Exception as e:
+            # Surfaced to the render thread through get_frame()
+            self.error = e
+            self._stop_event.set()
+
+    def _fill_slot(self, *arrays):
+        """Copy arrays into the next pool slot, (re)allocating it if shapes changed."""
+        frame = self._pool[self._slot]
+        if frame is None or any(f.shape != a.shape or f.dtype != a.dtype
+                                for f, a in zip(frame, arrays)):
+            frame = tuple(np.empty_like(a) for a in arrays)
+            self._pool[self._slot] = frame
+        for dst, src in zip(frame, arrays):
+            np.copyto(dst, src)
+        self._slot = (self._slot + 1) % FRAME_POOL_SIZE
+        return frame
+
+    def _put(self, frame):
+        # Block while the renderer is behind, waking up regularly to check for stop
+        while not self._stop_event.is_set():
+            try:
+                self.frames.put(frame, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def get_frame(self, timeout=None):
+        """
+        Wait for the next processed frame.
+
+        Returns:
+            tuple: (magnitude, audio_chunk, phase), or None if no frame arrived
+            within timeout. Re-raises an exception that stopped the worker.
+            The arrays are reused for later frames and stay valid only until
+            the next call; copy anything that must outlive it.
+        """
+        if self.error is not None:
+            raise self.error
+        try:
+            return self.frames.get(timeout=timeout)
+        except queue.Empty:
+            if self.error is not None:
+                raise self.error
+            return None
+
+    def stop(self):
+        """Ask the worker to exit; join() afterwards to wait for it."""
+        self._stop_event.set()
@@ -1,8 +1,10 @@
+import logging
 import time
 import numpy as np
 from src.config import CHUNK_SIZE
 from src.audio.base import AudioSource
 from src.dsp.pipeline import DSPPipeline
+from src.dsp.worker import DSPWorker
 from src.render.pygame_render import PyGameRenderer
 
 from src.audio.file_source import FileAudioSource
@@ -25,8 +27,12 @@ def main():
     parser.add_argument("--device", type=str, default=None, 
                         help="Audio input device (device ID, name, or 'hw:0,0'). Use --list-devices to see options.")
     parser.add_argument("--list-devices", action="store_true", help="List available audio input devices and exit")
+    parser.add_argument("--debug", action="store_true", help="Show detailed startup and device messages")
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format="%(levelname)s %(name)s: %(message)s")
+    
     # List devices and exit if requested
     if args.list_devices:
         list_audio_devices()
@@ -54,13 +60,18 @@ def main():
     
     audio.start()
     
+    # 1. Acquire Audio + 2. Process, on a background thread
+    worker = DSPWorker(audio, dsp)
+    worker.start()
+    
     try:
         while renderer.running:
-            # 1. Acquire Audio
-            data = audio.read_chunk()
-            
-            # 2. Process
-            magnitude, phase = dsp.process(data)
+            frame = worker.get_frame(timeout=0.5)
+            if frame is None:
+                # Nothing processed yet; keep the window responsive meanwhile
+                renderer.update()
+                continue
+            magnitude, data, phase = frame
             
             # 3. Render
             renderer.render(magnitude, data, phase)
@@ -69,6 +80,8 @@ def main():
     except KeyboardInterrupt:
         pass
     finally:
+        worker.stop()
+        worker.join(timeout=1.0)
         audio.stop()
         print("Exiting...")
 
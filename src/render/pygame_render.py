@@ -10,13 +10,22 @@ from ..config import (
     SILENCE_THRESHOLD, SHUFFLE_ENABLED_DEFAULT,
     MAX_HISTORY_CYCLES, SPECTROGRAM_HISTORY_LENGTH,
     MAX_PARTICLES, TERRAIN_HISTORY_DEPTH, TERRAIN_NUM_BINS,
-    TERRAIN_VERTICAL_LINE_STEP
+    TERRAIN_VERTICAL_LINE_STEP, TERRAIN_VERTICAL_DEPTH_STEP
 )
 import random
-from collections import deque
+
+def _peak(samples):
+    """Largest absolute sample value, from two reductions without an np.abs temporary."""
+    return max(samples.max(), -samples.min())
 
 class ParticleSystem:
-    """Efficient particle system using numpy arrays for Raspberry Pi performance."""
+    """
+    Efficient particle system using numpy arrays for Raspberry Pi performance.
+
+    Live particles are kept packed in slots [0, particle_count), so every
+    per-frame operation works on dense leading slices instead of masking
+    the whole pool.
+    """
     def __init__(self, max_particles=400):
         self.max_particles = max_particles
         # Particle properties stored as numpy arrays for efficiency
@@ -26,73 +35,117 @@ class ParticleSystem:
         self.colors = np.zeros((max_particles, 3), dtype=np.uint8)  # r, g, b
         self.lifetimes = np.zeros(max_particles, dtype=np.float32)
         self.ages = np.zeros(max_particles, dtype=np.float32)
-        self.active = np.zeros(max_particles, dtype=bool)
         self.particle_count = 0
+        self._arrays = (self.positions, self.velocities, self.sizes,
+                        self.colors, self.lifetimes, self.ages)
+        # Scratch for update(), so a frame's physics allocates no temporaries
+        self._step = np.zeros((max_particles, 2), dtype=np.float32)
+        self._alive = np.zeros(max_particles, dtype=bool)
     
     def spawn(self, x, y, vx, vy, size, color, lifetime):
         """Spawn a new particle if there's room."""
-        # Find first inactive particle
-        inactive_indices = np.where(~self.active)[0]
-        if len(inactive_indices) == 0:
+        idx = self.particle_count
+        if idx == self.max_particles:
             return  # No room for new particles
         
-        idx = inactive_indices[0]
         self.positions[idx] = [x, y]
         self.velocities[idx] = [vx, vy]
         self.sizes[idx] = size
         self.colors[idx] = color
         self.lifetimes[idx] = lifetime
         self.ages[idx] = 0.0
-        self.active[idx] = True
         self.particle_count += 1
     
+    def spawn_batch(self, positions, velocities, sizes, colors, lifetimes):
+        """
+        Spawn several particles at once from (n, 2) positions and velocities,
+        (n,) sizes and lifetimes and (n, 3) colors. Particles beyond the free
+        room are dropped, as with spawn().
+        """
+        start = self.particle_count
+        count = min(len(lifetimes), self.max_particles - start)
+        if count <= 0:
+            return
+        end = start + count
+        self.positions[start:end] = positions[:count]
+        self.velocities[start:end] = velocities[:count]
+        self.sizes[start:end] = sizes[:count]
+        self.colors[start:end] = colors[:count]
+        self.lifetimes[start:end] = lifetimes[:count]
+        self.ages[start:end] = 0.0
+        self.particle_count = end
+    
     def update(self, dt=1/60.0):
         """Update all active particles."""
-        if self.particle_count == 0:
+        n = self.particle_count
+        if n == 0:
             return
         
-        # Get active particles mask
-        active_mask = self.active
-        
         # Update positions
-        self.positions[active_mask] += self.velocities[active_mask] * dt
+        step = np.multiply(self.velocities[:n], dt, out=self._step[:n])
+        self.positions[:n] += step
         
         # Apply simple drag/friction
-        self.velocities[active_mask] *= 0.98
+        self.velocities[:n] *= 0.98
         
         # Update ages
-        self.ages[active_mask] += dt
-        
-        # Kill old particles
-        dead_mask = self.ages >= self.lifetimes
-        newly_dead = active_mask & dead_mask
-        self.active[newly_dead] = False
-        self.particle_count -= np.sum(newly_dead)
+        self.ages[:n] += dt
+        
+        # Kill old particles, packing the survivors to the front in order
+        alive = np.less(self.ages[:n], self.lifetimes[:n], out=self._alive[:n])
+        if not alive.all():
+            survivors = np.flatnonzero(alive)
+            count = len(survivors)
+            for array in self._arrays:
+                array[:count] = array[survivors]
+            self.particle_count = count
     
     def draw(self, surface):
         """Draw all active particles to the surface."""
         if self.particle_count == 0:
             return
         
-        active_mask = self.active
-        active_indices = np.where(active_mask)[0]
+        n = self.particle_count
+        x = self.positions[:n, 0]
+        y = self.positions[:n, 1]
         
-        for idx in active_indices:
-            x, y = self.positions[idx]
-            size = self.sizes[idx]
-            color = tuple(self.colors[idx])
-            
-            # Fade based on age
-            life_ratio = 1.0 - (self.ages[idx] / self.lifetimes[idx])
-            alpha = int(255 * life_ratio)
-            faded_color = tuple(int(c * life_ratio) for c in color)
-            
-            # Draw particle as circle
-            if 0 <= x < WINDOW_WIDTH and 0 <= y < WINDOW_HEIGHT:
-                pygame.draw.circle(surface, faded_color, (int(x), int(y)), max(1, int(size)))
+        # Only particles on screen are drawn
+        on_screen = (x >= 0) & (x < WINDOW_WIDTH) & (y >= 0) & (y < WINDOW_HEIGHT)
+        active_indices = np.flatnonzero(on_screen)
+        
+        # Fade based on age, computed for every particle at once
+        life_ratio = 1.0 - (self.ages[active_indices] / self.lifetimes[active_indices])
+        faded_colors = (self.colors[active_indices] * life_ratio[:, None]).astype(np.int32)
+        centers = self.positions[active_indices].astype(np.int32)
+        radii = np.maximum(1, self.sizes[active_indices].astype(np.int32))
+        
+        # Draw particles as circles
+        circle = pygame.draw.circle
+        for color, center, radius in zip(faded_colors.tolist(), centers.tolist(), radii.tolist()):
+            circle(surface, color, center, radius)
 
 
 class PyGameRenderer(Renderer):
+    # Modes whose picture depends only on the smoothed spectrum (and phase),
+    # so an unchanged input means an unchanged frame
+    STATIC_MODES = ('bars', 'line', 'radial', 'radial_curves', 'phase_clock')
+    
+    # Every (base_mode, sub_mode) combination, in spacebar cycling order
+    MODE_COMBINATIONS = (
+        ('spectrum', 'bars'),
+        ('spectrum', 'curves'),
+        ('radial', 'bars'),
+        ('radial', 'curves'),
+        ('wave', 'stream'),
+        ('wave', 'cycle'),
+        ('spectrogram', None),
+        ('phase_clock', None),
+        ('particles', None),
+        ('terrain', None),
+        ('eyes', None)
+    )
+    _MODE_COMBINATION_INDEX = {combo: i for i, combo in enumerate(MODE_COMBINATIONS)}
+    
     def __init__(self):
         pygame.init()
         # Set display mode with optional fullscreen
@@ -120,6 +173,8 @@ class PyGameRenderer(Renderer):
             "Spectral Terrain": "terrain",
             "Eyes": "eyes"
         }
+        # Dropdown entry showing each base mode
+        self._dropdown_idx = {self.mode_map[option]: i for i, option in enumerate(dropdown_options)}
         dropdown_width = 200
         dropdown_height = 40
         dropdown_x = WINDOW_WIDTH - dropdown_width - 10
@@ -157,16 +212,67 @@ class PyGameRenderer(Renderer):
         
         # Spectrogram setup
         self.spectrogram_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        if self.spectrogram_surf.get_bytesize() == 3:
+            # surfarray.pixels2d can't view 24-bit pixels; keep the image in 32 bits
+            self.spectrogram_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), 0, 32)
         self.spectrogram_surf.fill((0, 0, 0))
+        # Each frame's new row is gathered as mapped pixel values straight into
+        # the surface through a pixels2d view. The separator pixel is part of
+        # every row, so it scrolls with the image instead of being redrawn.
+        # Rows are written round-robin; _spec_write_row is the next one to replace.
+        self._spec_write_row = 0
+        self._spec_separator_pixel = self.spectrogram_surf.map_rgb((50, 50, 50))
+        pygame.draw.line(self.spectrogram_surf, (50, 50, 50),
+                         (WINDOW_WIDTH // 2, 0), (WINDOW_WIDTH // 2, WINDOW_HEIGHT))
         # Precompute colormaps for stereo channels
-        self.colormap_left = self._generate_colormap_cyan()   # Cyan for left
-        self.colormap_right = self._generate_colormap_magenta()  # Magenta for right
+        # Both live in one contiguous (channel, level, rgb) uint8 table, indexed
+        # directly by the uint8 levels from the log lookup table
+        self._spec_colormaps = np.stack((
+            self._generate_colormap_cyan(),     # Cyan for left
+            self._generate_colormap_magenta(),  # Magenta for right
+        ))
+        self.colormap_left = self._spec_colormaps[0]
+        self.colormap_right = self._spec_colormaps[1]
+        # Reused buffer for polyline points (see _pts); sized for the longest
+        # line drawn so far, starting with a full-width waveform
+        self._pts_buf = np.empty((WINDOW_WIDTH, 2), dtype=np.int32)
+        # Bin indices for resampling spectrum rows, keyed by (source, target)
+        # length and shared by all modes (see _resample_indices)
+        self._idx_cache = {}
+        # Evenly spread x coordinates for line and waveform modes, keyed by point count
+        self._x_cache = {}
+        # Magnitude -> colormap index table replacing the per-pixel log10
+        self._log_lut = self._generate_log_lut()
+        # Log table and colormaps fused: float top bits -> RGB per channel, so
+        # a new row takes one gather instead of a level pass plus a color pass
+        self._spec_color_lut = self._spec_colormaps[:, self._log_lut]  # (2, 65536, 3)
+        # The same table as pixel values in the spectrogram surface's format,
+        # flattened to (channel * 65536 + top bits) for a single np.take
+        pixel_dtype = pygame.surfarray.pixels2d(self.spectrogram_surf).dtype
+        self._spec_pixel_lut = pygame.surfarray.map_array(
+            self.spectrogram_surf, self._spec_color_lut).astype(pixel_dtype).ravel()
+        half_width = WINDOW_WIDTH // 2
+        self._spec_lut_offsets = np.repeat(np.arange(2, dtype=np.uint32) * len(self._log_lut), half_width)
+        # Per-frame scratch: resampled magnitudes of both channels, side by side,
+        # and their table indices
+        self._spec_values = np.empty(2 * half_width, dtype=np.float32)
+        self._spec_lut_idx = np.empty(2 * half_width, dtype=np.uint32)
+        # Gather indices into the flattened (2, bins) spectrum, keyed by (bins, width)
+        self._spec_flat_idx_cache = {}
+        
+        # Spline resampling matrices for the line and radial curve modes, keyed by
+        # mode and control point count (see _spline_matrix)
+        self._spline_cache = {}
+        # Fixed angle grids of the radial modes with their cos/sin (see _angle_table)
+        self._angle_cache = {}
         
         # Adaptive normalization & Smoothing
         self.running_max = 1.0  # Track maximum spectrum value
         self.max_decay = MAX_DECAY
         self.waveform_max = WAVEFORM_INITIAL_MAX
+        self._norm_buf = None
         self.smoothed_spectrum = None
+        self._smoothing_scratch = None
         self.smoothing_factor = SMOOTHING_FACTOR
         
         # Particle system setup
@@ -174,11 +280,18 @@ class PyGameRenderer(Renderer):
         self.particle_trail_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
         self.particle_trail_surf.fill((0, 0, 0))
         self.particle_trail_surf.set_alpha(255)
+        # Semi-transparent black laid over the trails each frame to fade them
+        self.particle_fade_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.particle_fade_surf.fill((0, 0, 0))
+        self.particle_fade_surf.set_alpha(25)  # Lower = longer trails, higher = faster fade
         
         # Spectral terrain setup
-        self.terrain_history_left = deque(maxlen=TERRAIN_HISTORY_DEPTH)
-        self.terrain_history_right = deque(maxlen=TERRAIN_HISTORY_DEPTH)
         self.terrain_num_bins = TERRAIN_NUM_BINS
+        # Ring buffer of the last TERRAIN_HISTORY_DEPTH frames per channel:
+        # the newest row is written over the oldest at _terrain_head
+        self.terrain_history = np.zeros((2, TERRAIN_HISTORY_DEPTH, TERRAIN_NUM_BINS), dtype=np.float32)
+        self._terrain_head = 0
+        self._terrain_rows = 0
         
         # Eyes visualizer setup
         # Precompute log-spaced bins for the available eyes (approx 44 for now)
@@ -214,6 +327,11 @@ class PyGameRenderer(Renderer):
         self.shuffle_enabled = SHUFFLE_ENABLED_DEFAULT
         self.was_silent = False
         self.silence_threshold = SILENCE_THRESHOLD
+        
+        # Redraw skipping: key of the last frame drawn in a static mode, and
+        # whether input events may have changed the UI since then
+        self._last_frame_key = None
+        self._ui_dirty = True
 
     def _on_mode_select(self, idx, option_name):
         """Callback when user selects a mode from dropdown"""
@@ -264,25 +382,8 @@ class PyGameRenderer(Renderer):
     
     def _random_mode_switch(self):
         """Switch to a random mode combination"""
-        import random
-        
-        # All possible mode combinations (equally weighted)
-        all_modes = [
-            ('spectrum', 'bars'),
-            ('spectrum', 'curves'),
-            ('radial', 'bars'),
-            ('radial', 'curves'),
-            ('wave', 'stream'),
-            ('wave', 'cycle'),
-            ('spectrogram', None),
-            ('phase_clock', None),
-            ('particles', None),
-            ('terrain', None),
-            ('eyes', None)
-        ]
-        
-        # Pick a random mode
-        new_base_mode, new_sub_mode = random.choice(all_modes)
+        # Pick a random mode (all combinations equally weighted)
+        new_base_mode, new_sub_mode = random.choice(self.MODE_COMBINATIONS)
         
         # Update mode
         self.base_mode = new_base_mode
@@ -290,20 +391,7 @@ class PyGameRenderer(Renderer):
         self._update_mode()
         
         # Update dropdown to match
-        mode_to_dropdown = {
-            'spectrum': 'Spectrum',
-            'radial': 'Radial',
-            'spectrogram': 'Spectrogram',
-            'wave': 'Oscilloscope',
-            'phase_clock': 'Phase Clock',
-            'particles': 'Particle Field',
-            'terrain': 'Spectral Terrain',
-            'eyes': 'Eyes'
-        }
-        
-        dropdown_option = mode_to_dropdown.get(self.base_mode)
-        if dropdown_option and dropdown_option in self.dropdown.options:
-            self.dropdown.selected_idx = self.dropdown.options.index(dropdown_option)
+        self.dropdown.selected_idx = self._dropdown_idx[self.base_mode]
     
     def _on_scale_select(self, idx, option_name):
         """Callback when user selects a scale from dropdown"""
@@ -316,7 +404,8 @@ class PyGameRenderer(Renderer):
         """
         # If manual scale is set, use it instead of automatic
         if self.scale_multiplier is not None:
-            return spectrum * self.scale_multiplier
+            return np.multiply(spectrum, self.scale_multiplier,
+                               out=self._normalized_buffer(spectrum, self.scale_multiplier))
         
         # Otherwise use automatic normalization
         # Get current max
@@ -333,9 +422,21 @@ class PyGameRenderer(Renderer):
         
         # Normalize
         if self.running_max > 0:
-            return spectrum / self.running_max
+            return np.divide(spectrum, self.running_max,
+                             out=self._normalized_buffer(spectrum, self.running_max))
         return spectrum
     
+    def _normalized_buffer(self, spectrum, factor):
+        """
+        Persistent output array for the normalized spectrum, so scaling writes
+        into the same memory every frame instead of allocating a new array.
+        """
+        dtype = np.result_type(spectrum, factor)
+        buf = self._norm_buf
+        if buf is None or buf.shape != spectrum.shape or buf.dtype != dtype:
+            buf = self._norm_buf = np.empty(spectrum.shape, dtype=dtype)
+        return buf
+    
     def _apply_smoothing(self, spectrum: np.ndarray) -> np.ndarray:
         """
         Apply exponential moving average (EMA) smoothing to the spectrum.
@@ -343,62 +444,72 @@ class PyGameRenderer(Renderer):
         """
         if self.smoothed_spectrum is None or self.smoothed_spectrum.shape != spectrum.shape:
             self.smoothed_spectrum = spectrum.copy()
+            self._smoothing_scratch = np.empty_like(self.smoothed_spectrum)
             return spectrum
         
         # EMA: new_sm = factor * old_sm + (1 - factor) * current
         # Actually it's smoother if we say: 
         # smoothed = alpha * previous + (1 - alpha) * current
-        self.smoothed_spectrum = (self.smoothing_factor * self.smoothed_spectrum + 
-                                (1 - self.smoothing_factor) * spectrum)
+        # Updated in place, with a persistent scratch array for the new term
+        np.multiply(self.smoothed_spectrum, self.smoothing_factor, out=self.smoothed_spectrum)
+        np.multiply(spectrum, 1 - self.smoothing_factor, out=self._smoothing_scratch)
+        self.smoothed_spectrum += self._smoothing_scratch
         return self.smoothed_spectrum
     
     
     def _generate_colormap_cyan(self):
         """Generate cyan colormap: Deep Blue -> Cyan -> Bright Cyan -> White"""
         cmap = np.zeros((256, 3), dtype=np.uint8)
-        for i in range(256):
-            if i < 85:  # Deep blue to cyan
-                # Start with deep blue (0, 0, 128) and transition to cyan
-                r = 0
-                g = int(i * 3.0)  # 0 to 255
-                b = int(128 + i * 1.5)  # 128 to 255
-                cmap[i] = (r, int(np.clip(g, 0, 255)), int(np.clip(b, 0, 255)))
-            elif i < 170:  # Cyan to bright cyan
-                r = 0
-                g = 255
-                b = 255
-                cmap[i] = (r, g, b)
-            else:  # Bright cyan to white
-                fade = (i - 170) / 85.0
-                r = int(fade * 255)
-                g = 255
-                b = 255
-                cmap[i] = (int(np.clip(r, 0, 255)), g, b)
+        i = np.arange(256)
+        low, mid, high = i < 85, (i >= 85) & (i < 170), i >= 170
+        # Deep blue to cyan: start with deep blue (0, 0, 128) and transition to cyan
+        cmap[low, 1] = np.clip((i[low] * 3.0).astype(int), 0, 255)  # 0 to 255
+        cmap[low, 2] = np.clip((128 + i[low] * 1.5).astype(int), 0, 255)  # 128 to 255
+        # Cyan to bright cyan
+        cmap[mid, 1:] = 255
+        # Bright cyan to white
+        fade = (i[high] - 170) / 85.0
+        cmap[high, 0] = np.clip((fade * 255).astype(int), 0, 255)
+        cmap[high, 1:] = 255
         return cmap
     
     def _generate_colormap_magenta(self):
         """Generate magenta colormap: Deep Purple -> Magenta -> Bright Magenta -> White"""
         cmap = np.zeros((256, 3), dtype=np.uint8)
-        for i in range(256):
-            if i < 85:  # Deep purple to magenta
-                # Start with deeper purple (64, 0, 96) and transition to magenta
-                r = int(64 + i * 2.25)  # 64 to 255
-                g = 0
-                b = int(96 + i * 1.87)  # 96 to 255
-                cmap[i] = (int(np.clip(r, 0, 255)), g, int(np.clip(b, 0, 255)))
-            elif i < 170:  # Magenta - make it brighter
-                r = 255
-                g = int((i - 85) * 1.5)  # 0 to ~127 for a bit of brightness
-                b = 255
-                cmap[i] = (r, int(np.clip(g, 0, 255)), b)
-            else:  # Bright magenta to white
-                fade = (i - 170) / 85.0
-                r = 255
-                g = int(127 + fade * 128)  # Continue from 127 to 255
-                b = 255
-                cmap[i] = (r, int(np.clip(g, 0, 255)), b)
+        i = np.arange(256)
+        low, mid, high = i < 85, (i >= 85) & (i < 170), i >= 170
+        # Deep purple to magenta: start with deeper purple (64, 0, 96) and transition to magenta
+        cmap[low, 0] = np.clip((64 + i[low] * 2.25).astype(int), 0, 255)  # 64 to 255
+        cmap[low, 2] = np.clip((96 + i[low] * 1.87).astype(int), 0, 255)  # 96 to 255
+        # Magenta - make it brighter
+        cmap[mid, 0] = 255
+        cmap[mid, 1] = np.clip(((i[mid] - 85) * 1.5).astype(int), 0, 255)  # 0 to ~127 for a bit of brightness
+        cmap[mid, 2] = 255
+        # Bright magenta to white
+        fade = (i[high] - 170) / 85.0
+        cmap[high, 0] = 255
+        cmap[high, 1] = np.clip((127 + fade * 128).astype(int), 0, 255)  # Continue from 127 to 255
+        cmap[high, 2] = 255
         return cmap
     
+    def _generate_log_lut(self):
+        """
+        Table mapping a float32 magnitude to its spectrogram colormap index,
+        indexed by the top 16 bits of the float (sign, exponent, 7 mantissa
+        bits). That quantization is logarithmic, so it stays within ~1% of the
+        exact magnitude across the whole range - unlike a linear table, which
+        is far too coarse near zero where most bins of a log display live.
+        """
+        high_bits = np.arange(65536, dtype=np.uint32)
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            # Midpoint of each bucket of floats sharing those top 16 bits
+            values = ((high_bits << 16) | 0x8000).view(np.float32).astype(np.float64)
+            # Same mapping as before: log10, approximate range [-3, 1] to [0, 1]
+            levels = (np.log10(values + 1e-6) + 3) / 4 * 255
+        # Negative magnitudes and NaNs can't come out of the FFT; map them to black
+        levels[~(values >= 0)] = 0
+        return np.clip(np.nan_to_num(levels, posinf=255), 0, 255).astype(np.uint8)
+    
     def _analyze_frequency_bands(self, spectrum):
         """
         Analyze frequency bands and return energy levels.
@@ -421,13 +532,13 @@ class PyGameRenderer(Renderer):
         """
         Simple perspective projection from 3D to 2D with camera tilt.
         Args:
-            x, y, z: 3D coordinates
+            x, y, z: 3D coordinates, as scalars or broadcastable arrays
             center_x, center_y: Screen center
             scale: Scaling factor
             camera_distance: Distance from camera (affects perspective)
             tilt_angle: Camera tilt angle in degrees (positive = looking down)
         Returns:
-            (screen_x, screen_y)
+            (screen_x, screen_y) as int32, broadcast to the inputs' shape
         """
         # Apply rotation around X-axis to tilt the view downward
         # This gives a bird's-eye perspective
@@ -444,18 +555,24 @@ class PyGameRenderer(Renderer):
         factor = camera_distance / (camera_distance + z_rot)
         screen_x = center_x + (x * scale * factor)
         screen_y = center_y - (y_rot * scale * factor)  # Negative because screen Y increases downward
-        return int(screen_x), int(screen_y)
+        return np.int32(screen_x), np.int32(screen_y)
 
     def render(self, spectrum: np.ndarray, audio_chunk: np.ndarray = None, phase: np.ndarray = None):
-        self.screen.fill((0, 0, 0)) # Clear screen
-        
         if spectrum is None or len(spectrum) == 0:
+            self.screen.fill((0, 0, 0)) # Clear screen
+            self._last_frame_key = None
             return
         
+        # All render math runs in float32. This is free for the pipeline's
+        # default output and widens float16 frames once up front
+        spectrum = np.asarray(spectrum, dtype=np.float32)
+        if phase is not None:
+            phase = np.asarray(phase, dtype=np.float32)
+        
         # Shuffle mode: detect silence and trigger mode change on audio resume
         if self.shuffle_enabled and audio_chunk is not None:
             # Calculate current audio amplitude
-            current_amplitude = np.max(np.abs(audio_chunk))
+            current_amplitude = _peak(audio_chunk)
             is_silent = current_amplitude < self.silence_threshold
             
             # Detect transition from silence to sound (not silent anymore, but was silent before)
@@ -471,6 +588,16 @@ class PyGameRenderer(Renderer):
         
         # Apply temporal smoothing to reduce jitter
         spectrum = self._apply_smoothing(spectrum)
+        
+        # Skip clearing, drawing and flipping when a static mode would show the
+        # same frame again (paused or silent audio) and the UI hasn't changed
+        frame_key = self._frame_key(spectrum, audio_chunk, phase)
+        if frame_key is not None and frame_key == self._last_frame_key and not self._ui_dirty:
+            return
+        self._last_frame_key = frame_key
+        self._ui_dirty = False
+        
+        self.screen.fill((0, 0, 0)) # Clear screen
 
         if self.mode == 'bars':
             self._render_bars(spectrum)
@@ -511,11 +638,106 @@ class PyGameRenderer(Renderer):
         
         pygame.display.flip()
 
+    def _frame_key(self, spectrum, audio_chunk, phase):
+        """
+        Return a key identifying the frame a static mode would draw from this
+        input, or None if the current mode can't be skipped.
+        """
+        if self.mode == 'wave' and self.scale_multiplier is not None and audio_chunk is not None:
+            # With a fixed scale there's no decaying amplitude to animate, so the
+            # trace depends only on the chunk
+            return (self.mode, self.scale_multiplier, audio_chunk.shape, audio_chunk.tobytes())
+        if self.mode not in self.STATIC_MODES:
+            return None
+        phase_bytes = phase.tobytes() if self.mode == 'phase_clock' and phase is not None else None
+        return (self.mode, spectrum.shape, spectrum.tobytes(), phase_bytes)
+
+    def _pts(self, x, y):
+        """
+        Pack x and y coordinate arrays into a point list for pygame.draw.lines.
+
+        Coordinates are truncated to int32 in a persistent (N, 2) buffer, grown
+        when a longer line comes along; pygame walks the nested list returned
+        by tolist() faster than the array itself.
+        """
+        n = len(x)
+        if len(self._pts_buf) < n:
+            self._pts_buf = np.empty((n, 2), dtype=np.int32)
+        points = self._pts_buf[:n]
+        points[:, 0] = x
+        points[:, 1] = y
+        return points.tolist()
+
+    def _spec_flat_indices(self, num_bins, limit, half_width):
+        """
+        Indices of both channels' resampled spectrogram bins in the flattened
+        (2, num_bins) spectrum, left channel first.
+        """
+        key = (num_bins, half_width)
+        flat_idx = self._spec_flat_idx_cache.get(key)
+        if flat_idx is None:
+            indices = self._resample_indices(limit, half_width)
+            flat_idx = (np.arange(2)[:, np.newaxis] * num_bins + indices).ravel()
+            self._spec_flat_idx_cache[key] = flat_idx
+        return flat_idx
+
+    def _x_coords(self, num_points):
+        """
+        Return num_points float32 x coordinates spread across the window,
+        cached by count. float32 is ample for pixel positions.
+        """
+        x = self._x_cache.get(num_points)
+        if x is None:
+            x = self._x_cache[num_points] = np.linspace(0, WINDOW_WIDTH, num_points, dtype=np.float32)
+        return x
+
+    def _resample_indices(self, src_len, dst_len):
+        """
+        Return dst_len evenly spaced indices into an array of src_len items.
+        They only depend on the sizes, so each pair is built once.
+        """
+        key = (src_len, dst_len)
+        indices = self._idx_cache.get(key)
+        if indices is None:
+            indices = np.linspace(0, src_len - 1, dst_len).astype(np.intp)
+            self._idx_cache[key] = indices
+        return indices
+
+    def _angle_table(self, key, make_angles):
+        """
+        Return (angles, cos, sin) for a fixed angle grid, built by make_angles
+        the first time key is seen. The arrays are shared and must not be modified.
+        """
+        table = self._angle_cache.get(key)
+        if table is None:
+            angles = make_angles()
+            table = (angles, np.cos(angles), np.sin(angles))
+            self._angle_cache[key] = table
+        return table
+
+    def _spline_matrix(self, key, x, x_fine, bc_type=None):
+        """
+        Return the matrix mapping control point values at x to the cubic
+        interpolating spline evaluated at x_fine.
+
+        An interpolating spline is linear in its data, so fitting it once to
+        the identity gives a (len(x_fine), n) matrix that turns every later
+        fit-and-evaluate into a matrix-vector product. With bc_type='periodic'
+        the last x is the closing point and is not a separate control value.
+        Matrices are cached under key, which must identify x and x_fine.
+        """
+        spl_matrix = self._spline_cache.get(key)
+        if spl_matrix is None:
+            basis = np.eye(len(x))
+            if bc_type == 'periodic':
+                basis = np.vstack((basis[:-1, :-1], basis[:1, :-1]))
+            spl = make_interp_spline(x, basis, k=3, bc_type=bc_type)
+            spl_matrix = spl(x_fine)
+            self._spline_cache[key] = spl_matrix
+        return spl_matrix
+
     def _render_spectrogram(self, spectrum):
         # spectrum: (2, N)
-        # Scroll up: Move existing image up by 1 pixel
-        self.spectrogram_surf.scroll(0, -1)
-        
         # Determine width for each channel
         half_width = WINDOW_WIDTH // 2
         
@@ -523,47 +745,41 @@ class PyGameRenderer(Renderer):
         # Limit to useful frequency range
         limit = spectrum.shape[1] // 2 
         
-        for ch in range(2):
-            data = spectrum[ch][:limit]
-            
-            # Resample data to fit half_width pixels
-            # Simple linear interpolation or binning
-            # For speed, let's just use simple binning/indexing
-            indices = np.linspace(0, len(data)-1, half_width).astype(int)
-            row_data = data[indices]
-            
-            # Normalize and map to 0-255
-            # Logarithmic scaling usually looks better for audio
-            row_data = np.log10(row_data + 1e-6) 
-            row_data = (row_data + 3) / 4 # Approximate normalization range [-3, 1] to [0, 1]
-            row_data = np.clip(row_data * 255, 0, 255).astype(int)
-            
-            # Convert to colors using channel-specific colormap
-            # Creating a surface for this thin line (1px high)
-            # Efficient way: create a buffer of pixels
-            
-            colormap = self.colormap_left if ch == 0 else self.colormap_right
-            colors = colormap[row_data]  # shape (half_width, 3)
-            # Fix broadcasting error: reshape to (width, height, 3)
-            colors = colors.reshape(-1, 1, 3)
-            
-            # Create a 1px high line surface
-            line_surf = pygame.Surface((half_width, 1))
-            
-            # Pygame surface locking for pixel access is slow in Python, 
-            # but blitting an array is tricky without deps. 
-            # Using pygame.surfarray is standard.
-            pygame.surfarray.pixels3d(line_surf)[:] = colors
-            
-            # Blit index logic
-            x_pos = 0 if ch == 0 else half_width
-            self.spectrogram_surf.blit(line_surf, (x_pos, WINDOW_HEIGHT - 1))
-            
-            # Draw separator
-            if ch == 0:
-                pygame.draw.line(self.spectrogram_surf, (50, 50, 50), (half_width, 0), (half_width, WINDOW_HEIGHT))
-
-        self.screen.blit(self.spectrogram_surf, (0, 0))
+        # Both channels are resampled, mapped and colored as (2, half_width)
+        # arrays, then written side by side into the new row
+        # Resample data to fit half_width pixels
+        # Simple linear interpolation or binning
+        # For speed, let's just use simple binning/indexing: one flat gather over
+        # both channel rows into a reused buffer, instead of a 2D fancy index
+        values = np.ascontiguousarray(spectrum[:2], dtype=np.float32).ravel()
+        flat_idx = self._spec_flat_indices(spectrum.shape[1], limit, half_width)
+        np.take(values, flat_idx, out=self._spec_values, mode='clip')
+        
+        # Normalize, map to 0-255 and convert to colors using the channel-specific
+        # colormap in one lookup. Logarithmic scaling usually looks better for
+        # audio; the log10 and normalization live in the table, indexed by the
+        # float's top bits.
+        lut_idx = np.right_shift(self._spec_values.view(np.uint32), 16, out=self._spec_lut_idx)
+        lut_idx += self._spec_lut_offsets
+        
+        # spectrogram_surf is a ring buffer of rows: the new row overwrites the
+        # oldest one instead of scrolling the whole image up by a pixel.
+        # np.take gathers pixel values straight into that row (left half, then
+        # right half); the view is dropped right away, since a locked surface
+        # can't be blitted.
+        row = self._spec_write_row
+        pixels = pygame.surfarray.pixels2d(self.spectrogram_surf)
+        np.take(self._spec_pixel_lut, lut_idx, out=pixels[:2 * half_width, row], mode='clip')
+        # Keep the separator on top of the new row
+        pixels[half_width, row] = self._spec_separator_pixel
+        del pixels
+        self._spec_write_row = (row + 1) % WINDOW_HEIGHT
+        
+        # Display oldest to newest: rows below the new one go on top, then the
+        # rows up to and including it, so the newest ends up at the bottom
+        older = WINDOW_HEIGHT - row - 1
+        self.screen.blit(self.spectrogram_surf, (0, 0), (0, row + 1, WINDOW_WIDTH, older))
+        self.screen.blit(self.spectrogram_surf, (0, older), (0, 0, WINDOW_WIDTH, row + 1))
 
     def _render_bars(self, spectrum):
         # Spectrum shape is (2, N)
@@ -571,23 +787,37 @@ class PyGameRenderer(Renderer):
         num_bins = spectrum.shape[1]
         
         bar_width = max(1, WINDOW_WIDTH // (num_bins // 4)) 
+        num_bars = min(num_bins // 4, WINDOW_WIDTH // bar_width)
         
         colors = [(0, 255, 255), (255, 0, 255)] # Cyan for Left, Magenta for Right
         
+        # All bar heights and positions are computed as arrays up front; only
+        # the draw calls are issued per bar
+        heights = np.minimum(WINDOW_HEIGHT,
+                             (spectrum[:, :num_bars] * WINDOW_HEIGHT * 0.9).astype(np.int32))
+        tops = WINDOW_HEIGHT - heights
+        bar_x = np.arange(num_bars) * bar_width
+        rect_width = bar_width - 1
+        
         for ch in range(num_channels):
-            for i in range(min(num_bins // 4, WINDOW_WIDTH // bar_width)):
-                 height = min(WINDOW_HEIGHT, int(spectrum[ch][i] * WINDOW_HEIGHT * 0.9))
-                 
-                 # Offset bars slightly for visibility if overlapping, or just blend
-                 # For now, simple overlay
-                 x = i * bar_width
-                 if ch == 1:
-                     x += 2 # Slight offset for right channel
-                     
-                 # Draw with transparency simulation (not native in simple rect, so just lines or distinct rects)
-                 # Converting to distinct rects
-                 rect = (x, WINDOW_HEIGHT - height, bar_width - 1, height)
-                 pygame.draw.rect(self.screen, colors[ch], rect, 1) # Outline for visibility overlay
+            # Offset bars slightly for visibility if overlapping, or just blend
+            # For now, simple overlay
+            x = bar_x + 2 if ch == 1 else bar_x # Slight offset for right channel
+            
+            # Zero-height bars draw nothing, so only the visible ones are visited
+            visible = np.flatnonzero(heights[ch] > 0)
+            bars = zip(x[visible].tolist(), tops[ch, visible].tolist(), heights[ch, visible].tolist())
+            
+            # Outlined rects for visibility overlay. An outline at most 2px wide
+            # has no interior, so it is drawn with the cheaper Surface.fill
+            color = colors[ch]
+            if rect_width <= 2:
+                fill = self.screen.fill
+                for bx, top, height in bars:
+                    fill(color, (bx, top, rect_width, height))
+            else:
+                for bx, top, height in bars:
+                    pygame.draw.rect(self.screen, color, (bx, top, rect_width, height), 1)
 
     def _render_line(self, spectrum):
         # Spectrum shape is (2, N)
@@ -596,26 +826,28 @@ class PyGameRenderer(Renderer):
         
         colors = [(0, 255, 255), (255, 0, 255)] # Cyan for Left, Magenta for Right
 
-        for ch in range(num_channels):
-            data = spectrum[ch][:limit]
-            
-            x = np.linspace(0, WINDOW_WIDTH, len(data))
-            y = WINDOW_HEIGHT - np.clip(data * WINDOW_HEIGHT * 0.9, 0, WINDOW_HEIGHT)
-            
-            if len(x) > 3:
-                try:
-                    x_smooth = np.linspace(x.min(), x.max(), 300) 
-                    spl = make_interp_spline(x, y, k=3)
-                    y_smooth = spl(x_smooth)
-                    y_smooth = np.clip(y_smooth, 0, WINDOW_HEIGHT)
-                    points = list(zip(x_smooth, y_smooth))
-                    
-                    if len(points) > 1:
-                        pygame.draw.lines(self.screen, colors[ch], False, points, 2)
-                except:
-                    points = list(zip(x, y))
-                    if len(points) > 1:
-                        pygame.draw.lines(self.screen, colors[ch], False, points, 2)
+        # Both channels share x, so their curves are computed as (channels, points)
+        # arrays; only the draw calls run per channel
+        data = spectrum[:, :limit]
+        
+        x = self._x_coords(data.shape[1])
+        y = WINDOW_HEIGHT - np.clip(data * WINDOW_HEIGHT * 0.9, 0, WINDOW_HEIGHT)
+        
+        if len(x) > 3:
+            # The cached spline matrix turns smoothing into a single
+            # matrix product, which has no per-frame failure mode
+            x_smooth = self._x_coords(300)
+            spl_matrix = self._spline_matrix(('line', len(x)), x, x_smooth)
+            y_smooth = y @ spl_matrix.T
+            y_smooth = np.clip(y_smooth, 0, WINDOW_HEIGHT)
+            
+            for ch in range(num_channels):
+                points = self._pts(x_smooth, y_smooth[ch])
+                pygame.draw.lines(self.screen, colors[ch], False, points, 2)
+        elif len(x) > 1:
+            # Too few points for a cubic spline; draw them as they are
+            for ch in range(num_channels):
+                pygame.draw.lines(self.screen, colors[ch], False, self._pts(x, y[ch]), 2)
     
     def _render_radial(self, spectrum):
         """
@@ -648,39 +880,40 @@ class PyGameRenderer(Renderer):
         # For each channel, we'll alternate bars around the circle
         # Or we can draw both channels with slight angle offset
         # Let's interleave them for a richer visual
-        
-        for i in range(num_bars):
-            # Angle for this bar (distribute evenly around circle)
-            angle = (2 * np.pi * i) / num_bars
-            
-            # Determine which channel to use (alternate)
-            ch = i % num_channels
-            
-            # Get spectrum value for this bar
-            bin_idx = int((i // num_channels) * (limit / (num_bars / num_channels)))
-            bin_idx = min(bin_idx, limit - 1)
-            magnitude = spectrum[ch][bin_idx]
-            
-            # Bar length based on magnitude
-            bar_length = magnitude * max_bar_length * 0.9  # 0.9 to leave some margin
-            
-            # Calculate start and end points
-            start_x = center_x + inner_radius * np.cos(angle)
-            start_y = center_y + inner_radius * np.sin(angle)
-            
-            end_x = center_x + (inner_radius + bar_length) * np.cos(angle)
-            end_y = center_y + (inner_radius + bar_length) * np.sin(angle)
-            
-            # Color interpolation based on magnitude for extra visual appeal
-            # Blend between darker and lighter versions
-            color_factor = min(1.0, magnitude * 1.5)
-            color = tuple(int(c * (0.3 + 0.7 * color_factor)) for c in colors[ch])
-            
-            # Draw the bar as a line
-            pygame.draw.line(self.screen, color, 
-                           (int(start_x), int(start_y)), 
-                           (int(end_x), int(end_y)), 
-                           3)  # Line width
+        # All bar geometry and colors are computed as arrays up front; only
+        # the draw calls are issued per bar.
+        bars = np.arange(num_bars)
+        
+        # Angle for each bar (distribute evenly around circle)
+        _, cos_a, sin_a = self._angle_table(('radial', num_bars),
+                                            lambda: (2 * np.pi * bars) / num_bars)
+        
+        # Determine which channel each bar uses (alternate)
+        channels = bars % num_channels
+        
+        # Get spectrum value for each bar
+        bin_idx = ((bars // num_channels) * (limit / (num_bars / num_channels))).astype(np.intp)
+        bin_idx = np.minimum(bin_idx, limit - 1)
+        magnitudes = spectrum[channels, bin_idx]
+        
+        # Bar length based on magnitude
+        bar_lengths = magnitudes * max_bar_length * 0.9  # 0.9 to leave some margin
+        
+        # Calculate start and end points
+        start_x = (center_x + inner_radius * cos_a).astype(np.int32)
+        start_y = (center_y + inner_radius * sin_a).astype(np.int32)
+        end_x = (center_x + (inner_radius + bar_lengths) * cos_a).astype(np.int32)
+        end_y = (center_y + (inner_radius + bar_lengths) * sin_a).astype(np.int32)
+        
+        # Color interpolation based on magnitude for extra visual appeal
+        # Blend between darker and lighter versions
+        color_factor = np.minimum(1.0, magnitudes * 1.5)
+        bar_colors = (np.array(colors, dtype=np.float32)[channels] * (0.3 + 0.7 * color_factor)[:, np.newaxis]).astype(np.int32)
+        
+        # Draw the bars as lines
+        for color, sx, sy, ex, ey in zip(bar_colors.tolist(), start_x.tolist(), start_y.tolist(),
+                                         end_x.tolist(), end_y.tolist()):
+            pygame.draw.line(self.screen, color, (sx, sy), (ex, ey), 3)  # Line width
 
     def _render_radial_curves(self, spectrum):
         """
@@ -705,56 +938,53 @@ class PyGameRenderer(Renderer):
         # Draw base circle
         pygame.draw.circle(self.screen, (30, 30, 30), (center_x, center_y), inner_radius, 1)
 
+        # Both channels are processed together as (channels, points) arrays;
+        # only the draw calls run per channel
+        # 1. Get stable control points by averaging bins
+        data = spectrum[:, :limit]
+        
+        # Simple bin averaging: view the usable prefix as one row per
+        # control point and reduce all rows in a single mean
+        bin_size = data.shape[1] // num_control_points
+        if bin_size > 0:
+            usable = bin_size * num_control_points
+            magnitudes = data[:, :usable].reshape(num_channels, num_control_points, bin_size).mean(axis=2)
+        else:
+            magnitudes = np.zeros((num_channels, num_control_points))
+        
+        # 2. Setup angles
+        angles = self._angle_table(
+            ('radial_curves', num_control_points),
+            lambda: np.linspace(0, 2 * np.pi, num_control_points, endpoint=False))[0]
+        
+        # Radii for control points
+        radii = inner_radius + magnitudes * (max_curve_reach - inner_radius)
+        
+        # 3. Handle periodicity (closure)
+        # scipy's periodic spline needs the first and last points to match;
+        # the cached matrix repeats radii[0] at 2*pi itself
+        angles_periodic = np.append(angles, 2 * np.pi)
+        
+        # 4. Interpolation
+        # 180 points is plenty for 800px display, and 2x faster than 360
+        num_interp_points = 180 
+        angles_fine, cos_vals, sin_vals = self._angle_table(
+            ('radial_curves', num_interp_points),
+            lambda: np.linspace(0, 2 * np.pi, num_interp_points))
+        
+        spl_matrix = self._spline_matrix(('radial', num_control_points),
+                                         angles_periodic, angles_fine,
+                                         bc_type='periodic')
+        radii_fine = radii @ spl_matrix.T
+        
+        # 5. Cartesian conversion - bulk calculation is faster
+        x = center_x + radii_fine * cos_vals
+        y = center_y + radii_fine * sin_vals
+        
         for ch in range(num_channels):
-            # 1. Get stable control points by averaging bins
-            data = spectrum[ch][:limit]
-            
-            # Simple bin averaging
-            bin_size = len(data) // num_control_points
-            magnitudes = []
-            for i in range(num_control_points):
-                chunk = data[i * bin_size : (i + 1) * bin_size]
-                magnitudes.append(np.mean(chunk) if len(chunk) > 0 else 0)
-            magnitudes = np.array(magnitudes)
-            
-            # 2. Setup angles
-            angles = np.linspace(0, 2 * np.pi, num_control_points, endpoint=False)
-            
-            # Radii for control points
-            radii = inner_radius + magnitudes * (max_curve_reach - inner_radius)
-            
-            # 3. Handle periodicity (closure)
-            # scipy's periodic spline needs the first and last points to match
-            radii_periodic = np.append(radii, radii[0])
-            angles_periodic = np.append(angles, 2 * np.pi)
-            
-            # 4. Interpolation
-            try:
-                # 180 points is plenty for 800px display, and 2x faster than 360
-                num_interp_points = 180 
-                angles_fine = np.linspace(0, 2 * np.pi, num_interp_points)
-                
-                spl = make_interp_spline(angles_periodic, radii_periodic, k=3, bc_type='periodic')
-                radii_fine = spl(angles_fine)
-                
-                # 5. Cartesian conversion - bulk calculation is faster
-                cos_vals = np.cos(angles_fine)
-                sin_vals = np.sin(angles_fine)
-                x = center_x + radii_fine * cos_vals
-                y = center_y + radii_fine * sin_vals
-                
-                points = list(zip(x.astype(int), y.astype(int)))
-                
-                if len(points) > 1:
-                    pygame.draw.lines(self.screen, colors[ch], True, points, 2)
-                    
-            except Exception as e:
-                # Minimal fallback
-                x = center_x + radii * np.cos(angles)
-                y = center_y + radii * np.sin(angles)
-                points = list(zip(x.astype(int), y.astype(int)))
-                if len(points) > 1:
-                    pygame.draw.lines(self.screen, colors[ch], True, points, 2)
+            points = self._pts(x[ch], y[ch])
+            if len(points) > 1:
+                pygame.draw.lines(self.screen, colors[ch], True, points, 2)
     
     def _render_phase_clock(self, spectrum, phase):
         """
@@ -789,56 +1019,66 @@ class PyGameRenderer(Renderer):
             phase_data = phase[ch][:limit]
             
             # Sample bins evenly
-            indices = np.linspace(0, len(mag_data) - 1, num_bins).astype(int)
+            indices = self._resample_indices(len(mag_data), num_bins)
             magnitudes = mag_data[indices]
             phases = phase_data[indices]
             
-            # Draw each bin as a rotating vector
-            for i in range(num_bins):
-                # Position angle around the circle (like clock tick marks)
-                position_angle = (2 * np.pi * i) / num_bins
-                
-                # Add slight offset between channels for visibility
-                if ch == 1:
-                    position_angle += (np.pi / num_bins)  # Half-step offset
-                
-                # Vector length based on magnitude
-                length = magnitudes[i] * max_length * 0.8
-                
-                # Rotation angle based on phase
-                # Phase is in radians (-π to π), use it directly for rotation
-                rotation = phases[i]
-                
-                # Combined angle: position + rotation from phase
-                total_angle = position_angle + rotation
-                
-                # Calculate end point of vector
-                end_x = center_x + length * np.cos(total_angle)
-                end_y = center_y + length * np.sin(total_angle)
-                
-                # Color variation based on frequency (bin index)
-                # Low frequencies (early bins) = warmer/dimmer
-                # High frequencies (later bins) = cooler/brighter
-                freq_factor = i / num_bins
-                
-                # Brightness based on magnitude
-                brightness = min(1.0, magnitudes[i] * 2.0)
-                
-                # Interpolate color: low freq = dim, high freq = bright
-                base_color = base_colors[ch]
-                color = tuple(int(c * (0.3 + 0.7 * freq_factor) * (0.4 + 0.6 * brightness)) for c in base_color)
-                
-                # Line thickness varies slightly with magnitude for depth
-                thickness = max(1, int(1 + brightness * 2))
-                
-                # Draw the vector from center to end point
-                pygame.draw.line(self.screen, color,
-                               (int(center_x), int(center_y)),
-                               (int(end_x), int(end_y)),
-                               thickness)
+            # Per-bin geometry and colors for all vectors at once; only the
+            # draw calls below need Python-level iteration
+            bins = np.arange(num_bins)
+            
+            # Position angle around the circle (like clock tick marks)
+            # Add slight offset between channels for visibility
+            offset = (np.pi / num_bins) if ch == 1 else 0.0  # Half-step offset
+            position_angles = self._angle_table(
+                ('phase_clock', num_bins, ch),
+                lambda: (2 * np.pi / num_bins) * bins + offset)[0]
+            
+            # Vector length based on magnitude
+            lengths = magnitudes * max_length * 0.8
+            
+            # Combined angle: position + rotation from phase
+            # Phase is in radians (-π to π), use it directly for rotation
+            total_angles = position_angles + phases
+            
+            # Calculate end points of vectors
+            end_x = (center_x + lengths * np.cos(total_angles)).astype(np.int32)
+            end_y = (center_y + lengths * np.sin(total_angles)).astype(np.int32)
+            
+            # Color variation based on frequency (bin index)
+            # Low frequencies (early bins) = warmer/dimmer
+            # High frequencies (later bins) = cooler/brighter
+            freq_factor = bins / num_bins
+            
+            # Brightness based on magnitude
+            brightness = np.minimum(1.0, magnitudes * 2.0)
+            
+            # Interpolate color: low freq = dim, high freq = bright
+            shade = (0.3 + 0.7 * freq_factor) * (0.4 + 0.6 * brightness)
+            colors = (np.array(base_colors[ch]) * shade[:, np.newaxis]).astype(np.int32)
+            
+            # Line thickness varies slightly with magnitude for depth
+            thicknesses = np.maximum(1, (1 + brightness * 2).astype(np.int32))
+            
+            # Draw each bin as a vector from center to end point
+            for color, ex, ey, thickness in zip(colors.tolist(), end_x.tolist(),
+                                                end_y.tolist(), thicknesses.tolist()):
+                pygame.draw.line(self.screen, color, (center_x, center_y), (ex, ey), thickness)
 
 
 
+    @staticmethod
+    def _random_velocities(count, min_speed, max_speed, boost=1.0):
+        """(count, 2) velocities in uniformly random directions and speeds."""
+        angles = np.random.uniform(0, 2 * np.pi, count)
+        speeds = np.random.uniform(min_speed, max_speed, count) * boost
+        return np.column_stack((speeds * np.cos(angles), speeds * np.sin(angles)))
+    
+    @staticmethod
+    def _random_channel_colors(count, cyan, magenta):
+        """Pick the cyan or magenta color at random for each of count particles."""
+        return np.array((cyan, magenta), dtype=np.uint8)[np.random.randint(0, 2, count)]
+    
     def _render_particle_field(self, spectrum):
         """
         Render sound-reactive particle field driven by frequency bands.
@@ -848,117 +1088,91 @@ class PyGameRenderer(Renderer):
         low_energy, mid_energy, high_energy = self._analyze_frequency_bands(spectrum)
         
         # Apply fade to trail surface for motion persistence
-        # Fill with semi-transparent black to create trailing effect
-        fade_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        fade_surface.fill((0, 0, 0))
-        fade_surface.set_alpha(25)  # Lower = longer trails, higher = faster fade
-        self.particle_trail_surf.blit(fade_surface, (0, 0))
+        # Blend semi-transparent black over it to create trailing effect
+        self.particle_trail_surf.blit(self.particle_fade_surf, (0, 0))
         
         # Center of screen for particle emission
         center_x = WINDOW_WIDTH // 2
         center_y = WINDOW_HEIGHT // 2
         
+        # Each band's particles are generated as arrays in a few numpy draws
+        # and added with one spawn_batch call
+        
         # LOW FREQUENCY - Heavy, slow particles (bass)
         # Spawn rate based on bass energy
         bass_spawn_count = int(low_energy * 15)  # Scale appropriately
-        for _ in range(bass_spawn_count):
+        if bass_spawn_count > 0:
             # Radial explosion from center
-            angle = random.uniform(0, 2 * np.pi)
-            speed = random.uniform(20, 60) * (1 + low_energy)
-            vx = speed * np.cos(angle)
-            vy = speed * np.sin(angle)
+            velocities = self._random_velocities(bass_spawn_count, 20, 60, 1 + low_energy)
+            positions = np.full((bass_spawn_count, 2), (center_x, center_y), dtype=np.float32)
             
             # Large, slow particles
-            size = random.uniform(4, 10) * (1 + low_energy * 0.5)
-            lifetime = random.uniform(2.0, 4.0)
+            sizes = np.random.uniform(4, 10, bass_spawn_count) * (1 + low_energy * 0.5)
+            lifetimes = np.random.uniform(2.0, 4.0, bass_spawn_count)
             
             # Cyan/Magenta base colors with variations
             # Alternate between channels for stereo effect
-            channel = random.choice([0, 1])
-            if channel == 0:  # Cyan channel
-                # Darker, more saturated cyan for bass
-                color_choice = (0, int(np.clip(150 + low_energy * 105, 0, 255)), int(np.clip(180 + low_energy * 75, 0, 255)))
-            else:  # Magenta channel
-                # Darker, more saturated magenta for bass
-                color_choice = (int(np.clip(180 + low_energy * 75, 0, 255)), 0, int(np.clip(150 + low_energy * 105, 0, 255)))
+            # Darker, more saturated cyan/magenta for bass
+            deep = int(np.clip(150 + low_energy * 105, 0, 255))
+            light = int(np.clip(180 + low_energy * 75, 0, 255))
+            colors = self._random_channel_colors(bass_spawn_count, (0, deep, light), (light, 0, deep))
             
-            self.particle_system.spawn(center_x, center_y, vx, vy, size, color_choice, lifetime)
+            self.particle_system.spawn_batch(positions, velocities, sizes, colors, lifetimes)
         
         # MID FREQUENCY - Turbulence and flow
         # Add turbulence to existing particles
-        if self.particle_system.particle_count > 0:
-            active_mask = self.particle_system.active
+        live_count = self.particle_system.particle_count
+        if live_count > 0:
             turbulence_strength = mid_energy * 50
             
             # Add random velocity perturbations
-            noise_x = np.random.uniform(-turbulence_strength, turbulence_strength, self.particle_system.max_particles)
-            noise_y = np.random.uniform(-turbulence_strength, turbulence_strength, self.particle_system.max_particles)
-            
-            self.particle_system.velocities[active_mask, 0] += noise_x[active_mask]
-            self.particle_system.velocities[active_mask, 1] += noise_y[active_mask]
+            noise = np.random.uniform(-turbulence_strength, turbulence_strength, (live_count, 2))
+            self.particle_system.velocities[:live_count] += noise
         
         # Spawn some mid-range particles
         mid_spawn_count = int(mid_energy * 8)
-        for _ in range(mid_spawn_count):
+        if mid_spawn_count > 0:
             # Random position variation
-            x = center_x + random.uniform(-50, 50)
-            y = center_y + random.uniform(-50, 50)
+            positions = np.random.uniform(-50, 50, (mid_spawn_count, 2)) + (center_x, center_y)
+            velocities = self._random_velocities(mid_spawn_count, 40, 100)
             
-            angle = random.uniform(0, 2 * np.pi)
-            speed = random.uniform(40, 100)
-            vx = speed * np.cos(angle)
-            vy = speed * np.sin(angle)
-            
-            size = random.uniform(2, 5)
-            lifetime = random.uniform(1.0, 2.0)
+            sizes = np.random.uniform(2, 5, mid_spawn_count)
+            lifetimes = np.random.uniform(1.0, 2.0, mid_spawn_count)
             
             # Cyan/Magenta base colors with mid-tone brightness
-            channel = random.choice([0, 1])
-            if channel == 0:  # Cyan channel
-                color_choice = (0, int(np.clip(200 + mid_energy * 55, 0, 255)), int(np.clip(220 + mid_energy * 35, 0, 255)))
-            else:  # Magenta channel
-                color_choice = (int(np.clip(220 + mid_energy * 35, 0, 255)), 0, int(np.clip(200 + mid_energy * 55, 0, 255)))
+            deep = int(np.clip(200 + mid_energy * 55, 0, 255))
+            light = int(np.clip(220 + mid_energy * 35, 0, 255))
+            colors = self._random_channel_colors(mid_spawn_count, (0, deep, light), (light, 0, deep))
             
-            self.particle_system.spawn(x, y, vx, vy, size, color_choice, lifetime)
+            self.particle_system.spawn_batch(positions, velocities, sizes, colors, lifetimes)
         
         # HIGH FREQUENCY - Fast, bright sparks (treble)
         spark_spawn_count = int(high_energy * 20)
-        for _ in range(spark_spawn_count):
-            # Emit from random positions or edges
-            if random.random() < 0.5:
-                # From center
-                x, y = center_x, center_y
-            else:
-                # From random edge
-                edge = random.choice(['top', 'bottom', 'left', 'right'])
-                if edge == 'top':
-                    x, y = random.uniform(0, WINDOW_WIDTH), 0
-                elif edge == 'bottom':
-                    x, y = random.uniform(0, WINDOW_WIDTH), WINDOW_HEIGHT
-                elif edge == 'left':
-                    x, y = 0, random.uniform(0, WINDOW_HEIGHT)
-                else:
-                    x, y = WINDOW_WIDTH, random.uniform(0, WINDOW_HEIGHT)
+        if spark_spawn_count > 0:
+            # Emit from a random point on a random edge (top, bottom, left,
+            # right), or from the center for about half of the sparks
+            edge = np.random.randint(0, 4, spark_spawn_count)
+            along = np.random.uniform(0, 1, spark_spawn_count)
+            edge_x = np.choose(edge, (along * WINDOW_WIDTH, along * WINDOW_WIDTH, 0, WINDOW_WIDTH))
+            edge_y = np.choose(edge, (0, WINDOW_HEIGHT, along * WINDOW_HEIGHT, along * WINDOW_HEIGHT))
+            from_center = np.random.random(spark_spawn_count) < 0.5
+            positions = np.column_stack((np.where(from_center, center_x, edge_x),
+                                         np.where(from_center, center_y, edge_y)))
             
             # Fast, random direction
-            angle = random.uniform(0, 2 * np.pi)
-            speed = random.uniform(150, 300) * (1 + high_energy)
-            vx = speed * np.cos(angle)
-            vy = speed * np.sin(angle)
+            velocities = self._random_velocities(spark_spawn_count, 150, 300, 1 + high_energy)
             
             # Small, short-lived
-            size = random.uniform(1, 3)
-            lifetime = random.uniform(0.2, 0.5)
+            sizes = np.random.uniform(1, 3, spark_spawn_count)
+            lifetimes = np.random.uniform(0.2, 0.5, spark_spawn_count)
             
             # Bright cyan/magenta sparks
-            channel = random.choice([0, 1])
             brightness = int(np.clip(200 + high_energy * 55, 0, 255))
-            if channel == 0:  # Bright cyan
-                color_choice = (brightness // 2, 255, 255)
-            else:  # Bright magenta
-                color_choice = (255, brightness // 2, 255)
+            colors = self._random_channel_colors(spark_spawn_count,
+                                                 (brightness // 2, 255, 255),
+                                                 (255, brightness // 2, 255))
             
-            self.particle_system.spawn(x, y, vx, vy, size, color_choice, lifetime)
+            self.particle_system.spawn_batch(positions, velocities, sizes, colors, lifetimes)
         
         # Update particle physics
         self.particle_system.update(dt=1/60.0)
@@ -974,85 +1188,70 @@ class PyGameRenderer(Renderer):
         Render stereo spectral terrain as 3D wireframe landscapes.
         Frequency = X axis, Amplitude = Y axis, Time = Z axis (depth).
         """
-        # Update terrain history buffers
-        left_data = spectrum[0][:self.terrain_num_bins]
-        right_data = spectrum[1][:self.terrain_num_bins]
-        
-        self.terrain_history_left.append(left_data.copy())
-        self.terrain_history_right.append(right_data.copy())
+        # Update terrain history buffers in place
+        history_depth = self.terrain_history.shape[1]
+        self.terrain_history[:, self._terrain_head] = spectrum[:2, :self.terrain_num_bins]
+        self._terrain_head = (self._terrain_head + 1) % history_depth
+        self._terrain_rows = min(self._terrain_rows + 1, history_depth)
         
         # Need at least 2 frames to draw terrain
-        if len(self.terrain_history_left) < 2:
+        if self._terrain_rows < 2:
             return
         
+        # Gather the stored rows newest first, so newest data is farthest away
+        # (scrolls toward viewer). Shape: (channels, depth, num_bins)
+        newest_first = (self._terrain_head - 1 - np.arange(self._terrain_rows)) % history_depth
+        terrain = self.terrain_history[:, newest_first]
+        
         # Rendering parameters
         half_width = WINDOW_WIDTH // 2
         
         # Side-by-side layout
         # Left channel: left half, Right channel: right half
         channels_data = [
-            (self.terrain_history_left, 0, half_width, (0, 255, 255)),  # Cyan
-            (self.terrain_history_right, half_width, WINDOW_WIDTH, (255, 0, 255))  # Magenta
+            (terrain[0], 0, half_width, (0, 255, 255)),  # Cyan
+            (terrain[1], half_width, WINDOW_WIDTH, (255, 0, 255))  # Magenta
         ]
         
-        for history, x_start, x_end, base_color in channels_data:
+        for terrain_data, x_start, x_end, base_color in channels_data:
             center_x = (x_start + x_end) // 2
             center_y = WINDOW_HEIGHT // 2
             
-            # Convert history deque to numpy array for easier manipulation
-            # Reverse so newest data is farthest away (scrolls toward viewer)
-            terrain_data = np.array(list(history))[::-1]  # Shape: (depth, num_bins)
-            depth = len(terrain_data)
+            depth = len(terrain_data)  # terrain_data shape: (depth, num_bins)
             
             # Scale factors
             x_scale = (x_end - x_start) / (self.terrain_num_bins + 1)
             y_scale = 150  # Amplitude scaling
             z_scale = 8    # Depth scaling
             
+            # Project every vertex of the (depth, num_bins) grid at once; only
+            # the draw calls below iterate
+            x = (np.arange(self.terrain_num_bins) - self.terrain_num_bins // 2) * x_scale
+            y = terrain_data * y_scale
+            z = np.arange(depth)[:, np.newaxis] * z_scale
+            screen_x, screen_y = self._project_3d_to_2d(x, y, z, center_x, center_y, scale=1.0)
+            points = np.stack((screen_x, screen_y), axis=-1)  # Shape: (depth, num_bins, 2)
+            
             # Draw wireframe
             # Draw horizontal lines (connecting frequency bins at same time/depth)
-            for z_idx in range(depth):
-                z = z_idx * z_scale
-                
+            if self.terrain_num_bins > 1:
                 # Brightness based on depth (farther = dimmer)
-                depth_factor = 1.0 - (z_idx / depth) * 0.7
-                color = tuple(int(c * depth_factor) for c in base_color)
-                
-                points = []
-                for x_idx in range(self.terrain_num_bins):
-                    x = (x_idx - self.terrain_num_bins // 2) * x_scale
-                    y = terrain_data[z_idx][x_idx] * y_scale
-                    
-                    screen_x, screen_y = self._project_3d_to_2d(x, y, z, center_x, center_y, scale=1.0)
-                    points.append((screen_x, screen_y))
-                
-                # Draw line connecting all points at this depth
-                if len(points) > 1:
-                    try:
-                        pygame.draw.lines(self.screen, color, False, points, 1)
-                    except:
-                        pass  # Skip if points are out of bounds
+                depth_factor = 1.0 - (np.arange(depth) / depth) * 0.7
+                colors = (np.array(base_color) * depth_factor[:, np.newaxis]).astype(np.int32)
+                for color, row in zip(colors.tolist(), points.tolist()):
+                    # Draw line connecting all points at this depth
+                    pygame.draw.lines(self.screen, color, False, row, 1)
             
             # Draw vertical lines (connecting same frequency across time/depth)
             # Draw fewer vertical lines for performance
-            for x_idx in range(0, self.terrain_num_bins, TERRAIN_VERTICAL_LINE_STEP):  # Every Nth bin
-                points = []
-                for z_idx in range(depth):
-                    z = z_idx * z_scale
-                    x = (x_idx - self.terrain_num_bins // 2) * x_scale
-                    y = terrain_data[z_idx][x_idx] * y_scale
-                    
-                    screen_x, screen_y = self._project_3d_to_2d(x, y, z, center_x, center_y, scale=1.0)
-                    points.append((screen_x, screen_y))
-                
+            # Use dimmer color for vertical lines
+            vert_color = tuple(int(c * 0.5) for c in base_color)
+            # Every Nth bin, through every Mth row; the first and last rows are
+            # always kept so the lines span the full depth
+            rows = np.union1d(np.arange(0, depth, TERRAIN_VERTICAL_DEPTH_STEP), depth - 1)
+            for column in points[rows, ::TERRAIN_VERTICAL_LINE_STEP].transpose(1, 0, 2).tolist():
                 # Draw line connecting all points for this frequency
-                if len(points) > 1:
-                    # Use dimmer color for vertical lines
-                    vert_color = tuple(int(c * 0.5) for c in base_color)
-                    try:
-                        pygame.draw.lines(self.screen, vert_color, False, points, 1)
-                    except:
-                        pass  # Skip if points are out of bounds
+                pygame.draw.lines(self.screen, vert_color, False, column, 1)
         
         # Draw center separator line
         pygame.draw.line(self.screen, (50, 50, 50), (half_width, 0), (half_width, WINDOW_HEIGHT), 1)
@@ -1186,20 +1385,22 @@ class PyGameRenderer(Renderer):
                                  max(1, int(current_pupil_radius * 0.2)))
 
 
+    def _find_trigger(self, left_channel):
+        """
+        Index of the first rising-edge zero crossing in the first half of the
+        buffer (so there is enough left to draw), or 0 if there is none.
+        """
+        # Simple algorithm: look for where value goes from negative to positive,
+        # as one vectorized sign test over the window instead of a Python loop
+        half = len(left_channel) // 2
+        crossings = np.flatnonzero((left_channel[:half] < 0) & (left_channel[1:half + 1] > 0))
+        return int(crossings[0]) if crossings.size else 0
+
     def _render_waveform(self, audio_chunk):
         # audio_chunk shape (CHUNK_SIZE, 2)
         # We need to stabilize the waveform using a simple zero-crossing trigger on the Left channel
         
-        trigger_idx = 0
-        # Find rising edge zero crossing
-        # Simple algorithm: look for where value goes from negative to positive
-        left_channel = audio_chunk[:, 0]
-        
-        # Searching for crossing in first half of buffer to ensure we have enough to draw
-        for i in range(len(left_channel) // 2):
-            if left_channel[i] < 0 and left_channel[i+1] > 0:
-                trigger_idx = i
-                break
+        trigger_idx = self._find_trigger(audio_chunk[:, 0])
                 
         # Draw length
         draw_len = min(len(audio_chunk) - trigger_idx, WINDOW_WIDTH)
@@ -1218,7 +1419,7 @@ class PyGameRenderer(Renderer):
         else:
             # Adaptive scaling
             # Track max amplitude for adaptive scaling
-            current_amp_max = np.max(np.abs(audio_chunk[trigger_idx : trigger_idx + draw_len, :]))
+            current_amp_max = _peak(audio_chunk[trigger_idx : trigger_idx + draw_len, :])
             if current_amp_max > self.waveform_max:
                 self.waveform_max = current_amp_max
             else:
@@ -1228,23 +1429,22 @@ class PyGameRenderer(Renderer):
             # Scale factor - use more of the screen height
             scale = (WINDOW_HEIGHT / 2) * 0.8 / max(self.waveform_max, 0.01)
         
+        data = audio_chunk[trigger_idx : trigger_idx + draw_len, :2]
+        
+        # X coordinates, shared by both channels
+        x = self._x_coords(len(data))
+        
+        # Y coordinates for both channels at once: Center is height/2. Data is -1.0 to 1.0
+        # Use adaptive scaling
+        y = (WINDOW_HEIGHT / 2) - (data * scale)
+        
+        # Offset Right channel slightly down or just color diff?
+        # Let's offset Y slightly for visibility
+        y[:, 1] += 2
+        
         for ch in range(2):
-            data = audio_chunk[trigger_idx : trigger_idx + draw_len, ch]
-            
-            # X coordinates
-            x = np.linspace(0, WINDOW_WIDTH, len(data))
-            
-            # Y coordinates: Center is height/2. Data is -1.0 to 1.0
-            # Use adaptive scaling
-            y = (WINDOW_HEIGHT / 2) - (data * scale)
-            
-            if ch == 1:
-                # Offset Right channel slightly down or just color diff?
-                # Let's offset Y slightly for visibility
-                y += 2
-            
             # Cast to int for pygame
-            points = list(zip(x.astype(int), y.astype(int)))
+            points = self._pts(x, y[:, ch])
             
             if len(points) > 1:
                pygame.draw.lines(self.screen, colors[ch], False, points, 2)
@@ -1261,11 +1461,8 @@ class PyGameRenderer(Renderer):
         # Use left channel for trigger detection
         left_channel = audio_chunk[:, 0]
         
-        # Find all rising edge zero crossings
-        zero_crossings = []
-        for i in range(len(left_channel) - 1):
-            if left_channel[i] < 0 and left_channel[i+1] >= 0:
-                zero_crossings.append(i)
+        # Find all rising edge zero crossings in one vectorized sign test
+        zero_crossings = np.flatnonzero((left_channel[:-1] < 0) & (left_channel[1:] >= 0))
         
         # Need at least 2 crossings to define a cycle
         if len(zero_crossings) < 2:
@@ -1275,8 +1472,8 @@ class PyGameRenderer(Renderer):
         
         # Extract the most recent complete cycle
         # Use the last two zero crossings
-        cycle_start = zero_crossings[-2]
-        cycle_end = zero_crossings[-1]
+        cycle_start = int(zero_crossings[-2])
+        cycle_end = int(zero_crossings[-1])
         cycle_length = cycle_end - cycle_start
         
         # Skip if cycle is too short or too long (noise/DC)
@@ -1297,7 +1494,7 @@ class PyGameRenderer(Renderer):
             scale = (WINDOW_HEIGHT / 2) * 0.8 * self.scale_multiplier
         else:
             # Adaptive scaling based on cycle amplitude
-            current_amp_max = np.max(np.abs(cycle_data))
+            current_amp_max = _peak(cycle_data)
             if current_amp_max > self.waveform_max:
                 self.waveform_max = current_amp_max
             else:
@@ -1311,7 +1508,7 @@ class PyGameRenderer(Renderer):
             data = cycle_data[:, ch]
             
             # X coordinates - stretch cycle to fill width
-            x = np.linspace(0, WINDOW_WIDTH, len(data))
+            x = self._x_coords(len(data))
             
             # Y coordinates
             y = (WINDOW_HEIGHT / 2) - (data * scale)
@@ -1319,7 +1516,7 @@ class PyGameRenderer(Renderer):
             if ch == 1:
                 y += 2  # Slight offset for visibility
             
-            points = list(zip(x.astype(int), y.astype(int)))
+            points = self._pts(x, y)
             
             if len(points) > 1:
                 pygame.draw.lines(self.screen, colors[ch], False, points, 2)
@@ -1333,13 +1530,13 @@ class PyGameRenderer(Renderer):
                 for ch in range(2):
                     if old_cycle.shape[0] > 0:
                         data = old_cycle[:, ch]
-                        x = np.linspace(0, WINDOW_WIDTH, len(data))
+                        x = self._x_coords(len(data))
                         y = (WINDOW_HEIGHT / 2) - (data * scale)
                         
                         if ch == 1:
                             y += 2
                         
-                        points = list(zip(x.astype(int), y.astype(int)))
+                        points = self._pts(x, y)
                         
                         if len(points) > 1:
                             # Draw with faded color
@@ -1348,6 +1545,8 @@ class PyGameRenderer(Renderer):
 
     def update(self):
         for event in pygame.event.get():
+            # Any event may change hover or selection state; redraw next frame
+            self._ui_dirty = True
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -1365,42 +1564,15 @@ class PyGameRenderer(Renderer):
             # Optional: Keep spacebar as a keyboard shortcut
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    # Cycle through all mode combinations
-                    all_modes = [
-                        ('spectrum', 'bars'),
-                        ('spectrum', 'curves'),
-                        ('radial', 'bars'),
-                        ('radial', 'curves'),
-                        ('wave', 'stream'),
-                        ('wave', 'cycle'),
-                        ('spectrogram', None),
-                        ('phase_clock', None),
-                        ('particles', None),
-                        ('terrain', None),
-                        ('eyes', None)
-                    ]
-                    
-                    # Find current mode in list
-                    current = (self.base_mode, self.sub_mode)
-                    try:
-                        current_idx = all_modes.index(current)
-                    except ValueError:
-                        current_idx = 0
+                    # Cycle through all mode combinations (an unknown current
+                    # one counts as the first)
+                    current_idx = self._MODE_COMBINATION_INDEX.get((self.base_mode, self.sub_mode), 0)
                     
                     # Move to next mode
-                    next_idx = (current_idx + 1) % len(all_modes)
-                    self.base_mode, self.sub_mode = all_modes[next_idx]
+                    next_idx = (current_idx + 1) % len(self.MODE_COMBINATIONS)
+                    self.base_mode, self.sub_mode = self.MODE_COMBINATIONS[next_idx]
                     self._update_mode()
                     
                     # Update dropdown to match base_mode
-                    dropdown_map = {
-                        'spectrum': 0,
-                        'radial': 1,
-                        'spectrogram': 2,
-                        'wave': 3,
-                        'phase_clock': 4,
-                        'particles': 5,
-                        'terrain': 6
-                    }
-                    self.dropdown.selected_idx = dropdown_map.get(self.base_mode, 0)
+                    self.dropdown.selected_idx = self._dropdown_idx[self.base_mode]
         self.clock.tick(FPS)
@@ -1,3 +1,4 @@
+import math
 import pygame
 
 class Dropdown:
@@ -15,59 +16,99 @@ class Dropdown:
         self.color_text = (200, 200, 200)
         self.color_border = (100, 100, 100)
         self.color_active = (0, 100, 200)
+        
+        # Option labels never change, so rasterize them once up front
+        self._label_surfs = [self.font.render(option, True, self.color_text) for option in options]
+        # Fully drawn collapsed button, keyed by (selected_idx, is_hovered)
+        self._button_cache = {}
+        # Option rows below the button: one rect per option, the area they
+        # cover together, and the drawn list keyed by (selected_idx, hovered_idx)
+        self._option_rects = [
+            pygame.Rect(self.rect.x, self.rect.bottom + i * self.rect.height, self.rect.width, self.rect.height)
+            for i in range(len(options))
+        ]
+        self._list_rect = pygame.Rect(self.rect.x, self.rect.bottom, self.rect.width, self.rect.height * len(options))
+        self._options_cache = {}
 
-    def draw(self, screen):
-        # Draw the main button (collapsed state)
-        # Mouse hover check for main button
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovered = self.rect.collidepoint(mouse_pos)
+    def _render_button(self, is_hovered):
+        """Draw the collapsed button (background, border, label, arrow) onto its own surface."""
+        surf = pygame.Surface(self.rect.size)
+        local_rect = surf.get_rect()
         
         bg_color = self.color_bg_hover if is_hovered else self.color_bg
-        pygame.draw.rect(screen, bg_color, self.rect)
-        pygame.draw.rect(screen, self.color_border, self.rect, 1)
+        pygame.draw.rect(surf, bg_color, local_rect)
+        pygame.draw.rect(surf, self.color_border, local_rect, 1)
         
         # Text
-        text_surf = self.font.render(self.options[self.selected_idx], True, self.color_text)
-        text_rect = text_surf.get_rect(center=self.rect.center)
-        screen.blit(text_surf, text_rect)
+        text_surf = self._label_surfs[self.selected_idx]
+        text_rect = text_surf.get_rect(center=local_rect.center)
+        surf.blit(text_surf, text_rect)
         
         # Draw arrow
         # Simple triangle
         arrow_points = [
-            (self.rect.right - 20, self.rect.centery - 5),
-            (self.rect.right - 10, self.rect.centery - 5),
-            (self.rect.right - 15, self.rect.centery + 5)
+            (local_rect.right - 20, local_rect.centery - 5),
+            (local_rect.right - 10, local_rect.centery - 5),
+            (local_rect.right - 15, local_rect.centery + 5)
         ]
-        pygame.draw.polygon(screen, self.color_text, arrow_points)
+        pygame.draw.polygon(surf, self.color_text, arrow_points)
+        return surf
+
+    def _render_options(self, hovered_idx):
+        """Draw the open option list onto its own surface."""
+        surf = pygame.Surface(self._list_rect.size)
+        for i, opt_rect in enumerate(self._option_rects):
+            local_rect = opt_rect.move(-self._list_rect.x, -self._list_rect.y)
+            
+            # Highlight if hovered or selected
+            if i == self.selected_idx:
+                opt_bg = self.color_active
+            elif i == hovered_idx:
+                opt_bg = self.color_bg_hover
+            else:
+                opt_bg = self.color_bg
+            
+            pygame.draw.rect(surf, opt_bg, local_rect)
+            pygame.draw.rect(surf, self.color_border, local_rect, 1)
+            
+            opt_text = self._label_surfs[i]
+            opt_text_rect = opt_text.get_rect(center=local_rect.center)
+            surf.blit(opt_text, opt_text_rect)
+        return surf
 
-        # Draw options if open
+    def draw(self, screen):
+        # Draw the main button (collapsed state)
+        # Mouse hover check for main button
+        mouse_pos = pygame.mouse.get_pos()
+        is_hovered = self.rect.collidepoint(mouse_pos)
+        
+        # The button only changes with the selection and hover state, so it is
+        # drawn once per state and blitted verbatim afterwards
+        key = (self.selected_idx, is_hovered)
+        button_surf = self._button_cache.get(key)
+        if button_surf is None:
+            button_surf = self._render_button(is_hovered)
+            self._button_cache[key] = button_surf
+        screen.blit(button_surf, self.rect)
+
+        # Draw options if open, cached the same way per selection and hovered option
         if self.is_open:
-            for i, option in enumerate(self.options):
-                opt_rect = pygame.Rect(self.rect.x, self.rect.bottom + i * self.rect.height, self.rect.width, self.rect.height)
-                
-                # Highlight if hovered or selected
-                is_opt_hovered = opt_rect.collidepoint(mouse_pos)
-                if i == self.selected_idx:
-                    opt_bg = self.color_active
-                elif is_opt_hovered:
-                    opt_bg = self.color_bg_hover
-                else:
-                    opt_bg = self.color_bg
-                
-                pygame.draw.rect(screen, opt_bg, opt_rect)
-                pygame.draw.rect(screen, self.color_border, opt_rect, 1)
-                
-                opt_text = self.font.render(option, True, self.color_text)
-                opt_text_rect = opt_text.get_rect(center=opt_rect.center)
-                screen.blit(opt_text, opt_text_rect)
+            hovered_idx = None
+            if self._list_rect.collidepoint(mouse_pos):
+                hovered_idx = (mouse_pos[1] - self._list_rect.y) // self.rect.height
+            key = (self.selected_idx, hovered_idx)
+            options_surf = self._options_cache.get(key)
+            if options_surf is None:
+                options_surf = self._render_options(hovered_idx)
+                self._options_cache[key] = options_surf
+            screen.blit(options_surf, self._list_rect)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1: # Left click
                 if self.is_open:
                     # Check if clicked on an option
-                    for i, _ in enumerate(self.options):
-                        opt_rect = pygame.Rect(self.rect.x, self.rect.bottom + i * self.rect.height, self.rect.width, self.rect.height)
+                    for i, opt_rect in enumerate(self._option_rects):
                         if opt_rect.collidepoint(event.pos):
                             self.selected_idx = i
                             self.is_open = False
@@ -116,32 +157,25 @@ class ModeToggleButton:
         self.color_bg_hover = (80, 80, 80, 200)  # Slightly lighter on hover
         self.color_icon = (255, 255, 255)  # White icon
         self.color_border = (100, 100, 100, 200)
+        # Fully drawn button, keyed by (current_mode, is_hovered)
+        self._button_cache = {}
     
     def set_mode(self, mode):
         """Update the current mode being displayed."""
         self.current_mode = mode
     
-    def draw(self, screen):
-        """Draw the circular toggle button with current mode icon."""
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Check if mouse is hovering (circular hit detection)
-        dx = mouse_pos[0] - self.center_x
-        dy = mouse_pos[1] - self.center_y
-        is_hovered = (dx * dx + dy * dy) <= (self.radius * self.radius)
-        
+    def _render_button(self, is_hovered):
+        """Draw the translucent circle and the current mode's icon onto their own surface."""
         # Create a surface with alpha for translucency
-        button_surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+        surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+        cx = cy = self.radius
         
         # Background color based on hover state
         bg_color = self.color_bg_hover if is_hovered else self.color_bg
         
         # Draw circle on the surface
-        pygame.draw.circle(button_surf, bg_color, (self.radius, self.radius), self.radius)
-        pygame.draw.circle(button_surf, self.color_border, (self.radius, self.radius), self.radius, 2)
-        
-        # Blit the translucent circle to screen
-        screen.blit(button_surf, (self.center_x - self.radius, self.center_y - self.radius))
+        pygame.draw.circle(surf, bg_color, (cx, cy), self.radius)
+        pygame.draw.circle(surf, self.color_border, (cx, cy), self.radius, 2)
         
         # Draw icon based on current mode
         if self.current_mode == 'bars':
@@ -151,13 +185,12 @@ class ModeToggleButton:
             spacing = 5
             
             for i in range(3):
-                x = self.center_x - spacing + (i * spacing)
-                y = self.center_y - bar_height // 2
-                pygame.draw.rect(screen, self.color_icon, (x - bar_width // 2, y, bar_width, bar_height))
+                x = cx - spacing + (i * spacing)
+                y = cy - bar_height // 2
+                pygame.draw.rect(surf, self.color_icon, (x - bar_width // 2, y, bar_width, bar_height))
         
         elif self.current_mode == 'curves':
             # Draw wavy line (~~)
-            import math
             wave_width = 20
             wave_height = 6
             num_points = 15
@@ -165,17 +198,16 @@ class ModeToggleButton:
             points = []
             for i in range(num_points):
                 t = i / (num_points - 1)
-                x = self.center_x - wave_width // 2 + t * wave_width
+                x = cx - wave_width // 2 + t * wave_width
                 # Two complete sine waves
-                y = self.center_y + wave_height * 0.5 * math.sin(t * 4 * math.pi)
+                y = cy + wave_height * 0.5 * math.sin(t * 4 * math.pi)
                 points.append((int(x), int(y)))
             
             if len(points) > 1:
-                pygame.draw.lines(screen, self.color_icon, False, points, 2)
+                pygame.draw.lines(surf, self.color_icon, False, points, 2)
         
         elif self.current_mode == 'stream':
             # Draw single continuous wave (~) for streaming oscilloscope
-            import math
             wave_width = 22
             wave_height = 7
             num_points = 20
@@ -183,17 +215,16 @@ class ModeToggleButton:
             points = []
             for i in range(num_points):
                 t = i / (num_points - 1)
-                x = self.center_x - wave_width // 2 + t * wave_width
+                x = cx - wave_width // 2 + t * wave_width
                 # Single smooth sine wave
-                y = self.center_y + wave_height * 0.5 * math.sin(t * 2 * math.pi)
+                y = cy + wave_height * 0.5 * math.sin(t * 2 * math.pi)
                 points.append((int(x), int(y)))
             
             if len(points) > 1:
-                pygame.draw.lines(screen, self.color_icon, False, points, 2)
+                pygame.draw.lines(surf, self.color_icon, False, points, 2)
         
         elif self.current_mode == 'cycle':
             # Draw circular arrow (⟲) for cycle-locked oscilloscope
-            import math
             # Draw a circular arc with an arrowhead
             arc_radius = 10
             arc_start = -0.3 * math.pi  # Start angle
@@ -205,17 +236,17 @@ class ModeToggleButton:
             for i in range(num_points):
                 t = i / (num_points - 1)
                 angle = arc_start + t * (arc_end - arc_start)
-                x = self.center_x + arc_radius * math.cos(angle)
-                y = self.center_y + arc_radius * math.sin(angle)
+                x = cx + arc_radius * math.cos(angle)
+                y = cy + arc_radius * math.sin(angle)
                 points.append((int(x), int(y)))
             
             if len(points) > 1:
-                pygame.draw.lines(screen, self.color_icon, False, points, 2)
+                pygame.draw.lines(surf, self.color_icon, False, points, 2)
             
             # Draw arrowhead at the end
             arrow_angle = arc_end
-            arrow_x = self.center_x + arc_radius * math.cos(arrow_angle)
-            arrow_y = self.center_y + arc_radius * math.sin(arrow_angle)
+            arrow_x = cx + arc_radius * math.cos(arrow_angle)
+            arrow_y = cy + arc_radius * math.sin(arrow_angle)
             
             # Arrow direction (tangent to circle)
             arrow_dir = arrow_angle + math.pi / 2
@@ -228,7 +259,26 @@ class ModeToggleButton:
                 (int(arrow_x - arrow_size * math.cos(arrow_dir - 0.4)), 
                  int(arrow_y - arrow_size * math.sin(arrow_dir - 0.4)))
             ]
-            pygame.draw.polygon(screen, self.color_icon, arrow_points)
+            pygame.draw.polygon(surf, self.color_icon, arrow_points)
+        return surf
+    
+    def draw(self, screen):
+        """Draw the circular toggle button with current mode icon."""
+        mouse_pos = pygame.mouse.get_pos()
+        
+        # Check if mouse is hovering (circular hit detection)
+        dx = mouse_pos[0] - self.center_x
+        dy = mouse_pos[1] - self.center_y
+        is_hovered = (dx * dx + dy * dy) <= (self.radius * self.radius)
+        
+        # The button only changes with the mode and hover state, so each state
+        # is drawn once and blitted verbatim afterwards
+        key = (self.current_mode, is_hovered)
+        button_surf = self._button_cache.get(key)
+        if button_surf is None:
+            button_surf = self._render_button(is_hovered)
+            self._button_cache[key] = button_surf
+        screen.blit(button_surf, (self.center_x - self.radius, self.center_y - self.radius))
     
     def handle_event(self, event):
         """Handle mouse events."""
@@ -0,0 +1,40 @@
+import os
+import unittest
+import numpy as np
+import pygame
+from src.render.pygame_render import PyGameRenderer
+from src.config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+class TestBarsRender(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.renderer = PyGameRenderer()
+        self.renderer.mode = 'bars'
+
+    def _reference(self, spectrum):
+        # One outlined draw.rect per bar, as the bars mode is defined
+        surf = pygame.Surface(self.renderer.screen.get_size())
+        num_bins = spectrum.shape[1]
+        bar_width = max(1, WINDOW_WIDTH // (num_bins // 4))
+        colors = [(0, 255, 255), (255, 0, 255)]
+        for ch in range(2):
+            for i in range(min(num_bins // 4, WINDOW_WIDTH // bar_width)):
+                height = min(WINDOW_HEIGHT, int(spectrum[ch][i] * WINDOW_HEIGHT * 0.9))
+                x = i * bar_width + (2 if ch == 1 else 0)
+                pygame.draw.rect(surf, colors[ch], (x, WINDOW_HEIGHT - height, bar_width - 1, height), 1)
+        return pygame.surfarray.array3d(surf)
+
+    def test_matches_outlined_rects(self):
+        rng = np.random.default_rng(3)
+        # 1025 bins give 2px bars (filled); 129 bins give wider, hollow outlines
+        for num_bins in (1025, 129):
+            spectrum = rng.uniform(0, 1.2, (2, num_bins)).astype(np.float32)
+            spectrum[:, ::7] = 0
+            self.renderer.screen.fill((0, 0, 0))
+            self.renderer._render_bars(spectrum)
+            np.testing.assert_array_equal(pygame.surfarray.array3d(self.renderer.screen),
+                                          self._reference(spectrum))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import types
+import unittest
+from unittest import mock
+import numpy as np
+from src.dsp import pipeline
+from src.dsp.pipeline import DSPPipeline
+from src.config import SAMPLE_RATE, FFT_SIZE
+
+class TestDSPPipeline(unittest.TestCase):
+    def setUp(self):
+        self.dsp = DSPPipeline()
+
+    def _sine(self, freq, amplitude=0.5, dtype=np.float32):
+        t = np.arange(FFT_SIZE) / SAMPLE_RATE
+        tone = amplitude * np.sin(2 * np.pi * freq * t)
+        return np.stack((tone, tone), axis=1).astype(dtype)
+
+    def test_output_shapes(self):
+        magnitude, phase = self.dsp.process(self._sine(1000))
+        self.assertEqual(magnitude.shape, (2, FFT_SIZE // 2 + 1))
+        self.assertEqual(phase.shape, (2, FFT_SIZE // 2 + 1))
+        # Channel-major output: each channel's spectrum is a contiguous row
+        self.assertTrue(magnitude.flags['C_CONTIGUOUS'])
+        self.assertTrue(phase.flags['C_CONTIGUOUS'])
+
+    def test_float64_input_stays_single_precision(self):
+        """Float64 chunks (e.g. from resampling) should not upcast the FFT."""
+        magnitude, phase = self.dsp.process(self._sine(1000, dtype=np.float64))
+        self.assertEqual(magnitude.dtype, np.float32)
+        self.assertEqual(phase.dtype, np.float32)
+
+    def test_peak_bin_matches_tone(self):
+        freq = 1000
+        magnitude, _ = self.dsp.process(self._sine(freq))
+        expected_bin = round(freq * FFT_SIZE / SAMPLE_RATE)
+        self.assertLessEqual(abs(int(np.argmax(magnitude[0])) - expected_bin), 1)
+
+    def test_matches_reference_fft(self):
+        """Whichever FFT backend is active must agree with numpy's rfft."""
+        chunk = np.random.default_rng(0).uniform(-1, 1, (FFT_SIZE, 2)).astype(np.float32)
+        magnitude, _ = self.dsp.process(chunk)
+        reference = np.abs(np.fft.rfft(chunk * np.hanning(FFT_SIZE)[:, np.newaxis], axis=0)).T
+        np.testing.assert_allclose(magnitude, reference, rtol=1e-3, atol=1e-3)
+
+    def test_short_chunk_is_zero_padded(self):
+        """A short chunk must not pick up stale samples from a previous frame."""
+        self.dsp.process(np.ones((FFT_SIZE, 2), dtype=np.float32))
+        short = self._sine(1000)[:FFT_SIZE // 2]
+        magnitude, _ = self.dsp.process(short)
+        padded = np.zeros((FFT_SIZE, 2), dtype=np.float32)
+        padded[:len(short)] = short
+        reference = np.abs(np.fft.rfft(padded * np.hanning(FFT_SIZE)[:, np.newaxis], axis=0)).T
+        np.testing.assert_allclose(magnitude, reference, rtol=1e-3, atol=1e-3)
+
+    def test_mono_input_is_duplicated(self):
+        mono = self._sine(1000)[:, :1]
+        magnitude, phase = self.dsp.process(mono)
+        self.assertEqual(magnitude.shape, (2, FFT_SIZE // 2 + 1))
+        np.testing.assert_array_equal(magnitude[0], magnitude[1])
+        np.testing.assert_array_equal(phase[0], phase[1])
+
+    def test_power_is_squared_magnitude(self):
+        chunk = self._sine(3000)
+        magnitude, _ = self.dsp.process(chunk)
+        power = self.dsp.process_power(chunk)
+        np.testing.assert_allclose(power, magnitude ** 2, rtol=1e-4, atol=1e-4)
+
+    def test_phase_matches_numpy_angle(self):
+        chunk = np.random.default_rng(1).uniform(-1, 1, (FFT_SIZE, 2)).astype(np.float32)
+        _, phase = self.dsp.process(chunk)
+        reference = np.angle(np.fft.rfft(chunk * np.hanning(FFT_SIZE)[:, np.newaxis], axis=0)).T
+        # Compare on the unit circle so +pi / -pi at near-real bins don't count as errors
+        np.testing.assert_allclose(np.exp(1j * phase), np.exp(1j * reference), atol=1e-3)
+
+    def test_float16_output(self):
+        chunk = self._sine(1000)
+        reference, reference_phase = DSPPipeline().process(chunk)
+        magnitude, phase = DSPPipeline(output_dtype=np.float16).process(chunk)
+        self.assertEqual(magnitude.dtype, np.float16)
+        self.assertEqual(phase.dtype, np.float16)
+        np.testing.assert_allclose(magnitude, reference, rtol=1e-3, atol=1e-3)
+        np.testing.assert_allclose(phase, reference_phase, rtol=1e-3, atol=1e-2)
+
+    def test_unfriendly_fft_size_is_padded_to_fast_length(self):
+        # 2039 is prime; the pipeline should round up rather than transform it directly
+        with mock.patch.object(pipeline, 'FFT_SIZE', 2039), mock.patch('builtins.print'):
+            dsp = DSPPipeline()
+        self.assertEqual(dsp._n, 2048)
+        magnitude, phase = dsp.process(np.ones((2039, 2), dtype=np.float32))
+        self.assertEqual(magnitude.shape, (2, 2048 // 2 + 1))
+        self.assertEqual(phase.shape, (2, 2048 // 2 + 1))
+
+    def test_silent_chunk_skips_fft(self):
+        self.dsp.process(self._sine(1000))
+        quiet = self._sine(1000, amplitude=self.dsp.silence_threshold / 2)
+        with mock.patch.object(self.dsp, '_transform') as transform:
+            magnitude, phase = self.dsp.process(quiet)
+            power = self.dsp.process_power(quiet)
+        transform.assert_not_called()
+        # Zeroed even though the buffers held the previous tone
+        np.testing.assert_array_equal(magnitude, 0.0)
+        np.testing.assert_array_equal(phase, 0.0)
+        np.testing.assert_array_equal(power, 0.0)
+
+    def test_zero_threshold_always_transforms(self):
+        dsp = DSPPipeline(silence_threshold=0.0)
+        magnitude, _ = dsp.process(self._sine(1000, amplitude=1e-6))
+        self.assertGreater(magnitude.max(), 0.0)
+
+    def test_scipy_backend_matches_default(self):
+        chunk = self._sine(2000)
+        dsp = DSPPipeline(backend='scipy')
+        self.assertEqual(dsp.backend, 'scipy')
+        np.testing.assert_allclose(dsp.process(chunk)[0], self.dsp.process(chunk)[0],
+                                   rtol=1e-4, atol=1e-4)
+
+    def test_scipy_input_buffer_is_aligned(self):
+        dsp = DSPPipeline(backend='scipy')
+        self.assertEqual(dsp._fft_in.ctypes.data % pipeline.SIMD_ALIGNMENT, 0)
+        self.assertEqual(dsp._fft_in.shape, (2, dsp._n))
+        self.assertEqual(dsp._fft_in.dtype, np.float32)
+
+    def test_missing_cupy_falls_back(self):
+        with mock.patch.object(pipeline, '_import_cupy', return_value=None), \
+                mock.patch('builtins.print'):
+            dsp = DSPPipeline(backend='cupy')
+        self.assertIn(dsp.backend, ('scipy', 'pyfftw'))
+
+    def test_cupy_backend_copies_result_to_host(self):
+        class FakeDeviceArray:
+            def __init__(self, data):
+                self.data = data
+            def get(self, out):
+                np.copyto(out, self.data)
+                return out
+        fake_cupy = types.SimpleNamespace(
+            asarray=np.array,
+            fft=types.SimpleNamespace(rfft=lambda x, axis: FakeDeviceArray(np.fft.rfft(x, axis=axis))))
+        with mock.patch.object(pipeline, '_import_cupy', return_value=fake_cupy):
+            dsp = DSPPipeline(backend='cupy')
+        self.assertEqual(dsp.backend, 'cupy')
+        chunk = self._sine(2000)
+        np.testing.assert_allclose(dsp.process(chunk)[0], self.dsp.process(chunk)[0],
+                                   rtol=1e-4, atol=1e-4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from src.audio.base import AudioSource
+from src.dsp.worker import DSPWorker, FRAME_QUEUE_SIZE, FRAME_POOL_SIZE
+from src.config import CHUNK_SIZE
+
+class CountingSource(AudioSource):
+    """Returns chunks filled with the read count, reusing one buffer like the real sources."""
+    def __init__(self):
+        self.reads = 0
+        self.buffer = np.zeros((CHUNK_SIZE, 2), dtype=np.float32)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def read_chunk(self):
+        self.reads += 1
+        self.buffer.fill(self.reads)
+        return self.buffer
+
+class FailingSource(CountingSource):
+    def read_chunk(self):
+        raise RuntimeError("device unplugged")
+
+class TestDSPWorker(unittest.TestCase):
+    def _start(self, source):
+        worker = DSPWorker(source)
+        worker.start()
+        self.addCleanup(worker.join, 1.0)
+        self.addCleanup(worker.stop)
+        return worker
+
+    def test_frames_arrive_in_order_with_own_buffers(self):
+        worker = self._start(CountingSource())
+        first = worker.get_frame(timeout=1.0)
+        second = worker.get_frame(timeout=1.0)
+        magnitude, data, phase = first
+        self.assertEqual(magnitude.shape[0], 2)
+        self.assertEqual(phase.shape, magnitude.shape)
+        # Frames must not alias the source's reused buffer
+        np.testing.assert_array_equal(data, 1.0)
+        np.testing.assert_array_equal(second[1], 2.0)
+
+    def test_frame_buffers_are_recycled(self):
+        worker = self._start(CountingSource())
+        frames = [worker.get_frame(timeout=1.0) for _ in range(FRAME_POOL_SIZE + 1)]
+        self.assertIs(frames[0][1], frames[FRAME_POOL_SIZE][1])
+        # The most recent frame still holds its own data while others rotate
+        np.testing.assert_array_equal(frames[-1][1], FRAME_POOL_SIZE + 1)
+
+    def test_worker_is_paced_by_the_consumer(self):
+        source = CountingSource()
+        worker = self._start(source)
+        worker.get_frame(timeout=1.0)
+        worker.join(0.2)
+        # One frame taken, the queue refilled, plus one chunk blocked on put
+        self.assertLessEqual(source.reads, FRAME_QUEUE_SIZE + 2)
+
+    def test_stop_ends_thread(self):
+        worker = self._start(CountingSource())
+        worker.stop()
+        worker.join(1.0)
+        self.assertFalse(worker.is_alive())
+
+    def test_errors_are_raised_to_the_consumer(self):
+        worker = self._start(FailingSource())
+        worker.join(1.0)
+        with self.assertRaises(RuntimeError):
+            worker.get_frame(timeout=0.1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import numpy as np
+import scipy.io.wavfile as wav
+from src.audio import file_source
+from src.audio.file_source import FileAudioSource
+from src.config import SAMPLE_RATE, CHUNK_SIZE
+
+class TestFileAudioSource(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        # Keep the resample cache out of the real home directory
+        self.cache_dir = Path(self.tmpdir.name) / "cache"
+        patcher = mock.patch.object(file_source, 'CACHE_DIR', self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write_wav(self, data, rate=SAMPLE_RATE, name="test.wav"):
+        path = os.path.join(self.tmpdir.name, name)
+        wav.write(path, rate, data)
+        return path
+
+    def _ramp(self, num_frames):
+        """Stereo float32 ramp so every frame is identifiable."""
+        ramp = np.linspace(-0.5, 0.5, num_frames, dtype=np.float32)
+        return np.stack((ramp, -ramp), axis=1)
+
+    def test_loop_wraps_to_start(self):
+        length = CHUNK_SIZE * 2 + CHUNK_SIZE // 2
+        data = self._ramp(length)
+        source = FileAudioSource(self._write_wav(data), loop=True)
+        source.start()
+        
+        chunks = [source.read_chunk().copy() for _ in range(3)]
+        expected = np.concatenate((data, data))[:CHUNK_SIZE * 3]
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+    def test_loop_repeats_file_shorter_than_chunk(self):
+        length = CHUNK_SIZE // 3 + 1
+        data = self._ramp(length)
+        source = FileAudioSource(self._write_wav(data), loop=True)
+        source.start()
+        
+        chunks = [source.read_chunk().copy() for _ in range(2)]
+        expected = np.tile(data, (CHUNK_SIZE * 2 // length + 1, 1))[:CHUNK_SIZE * 2]
+        np.testing.assert_array_equal(np.concatenate(chunks), expected)
+
+    def test_no_loop_pads_with_silence(self):
+        length = CHUNK_SIZE + CHUNK_SIZE // 4
+        data = self._ramp(length)
+        source = FileAudioSource(self._write_wav(data), loop=False)
+        source.start()
+        
+        source.read_chunk()
+        chunk = source.read_chunk()
+        tail = length - CHUNK_SIZE
+        np.testing.assert_array_equal(chunk[:tail], data[CHUNK_SIZE:])
+        np.testing.assert_array_equal(chunk[tail:], 0.0)
+        # Past the end the source keeps returning silence
+        np.testing.assert_array_equal(source.read_chunk(), 0.0)
+
+    def test_chunks_are_float32_stereo(self):
+        source = FileAudioSource(self._write_wav(self._ramp(CHUNK_SIZE * 2)))
+        source.start()
+        chunk = source.read_chunk()
+        self.assertEqual(chunk.shape, (CHUNK_SIZE, 2))
+        self.assertEqual(chunk.dtype, np.float32)
+
+    def test_int16_mono_is_converted_per_chunk(self):
+        samples = np.array([0, 16384, -32768, 32767] * CHUNK_SIZE, dtype=np.int16)
+        source = FileAudioSource(self._write_wav(samples))
+        source.start()
+        
+        # Native-rate files stay memory mapped in their stored format
+        self.assertIsInstance(source.data, np.memmap)
+        self.assertEqual(source.data.dtype, np.int16)
+        chunk = source.read_chunk()
+        self.assertEqual(chunk.shape, (CHUNK_SIZE, 2))
+        self.assertEqual(chunk.dtype, np.float32)
+        expected = samples[:CHUNK_SIZE].astype(np.float32) / 32768.0
+        np.testing.assert_array_equal(chunk[:, 0], expected)
+        np.testing.assert_array_equal(chunk[:, 1], expected)
+
+    def test_uint8_is_centred(self):
+        samples = np.array([128, 255, 0, 192] * CHUNK_SIZE, dtype=np.uint8)
+        source = FileAudioSource(self._write_wav(np.stack((samples, samples), axis=1)))
+        source.start()
+        chunk = source.read_chunk()
+        expected = (samples[:CHUNK_SIZE].astype(np.float32) - 128.0) / 128.0
+        np.testing.assert_array_equal(chunk[:, 0], expected)
+
+    def test_resamples_to_target_rate(self):
+        src_rate = 44100
+        freq = 1000
+        t = np.arange(src_rate) / src_rate
+        tone = (0.5 * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+        source = FileAudioSource(self._write_wav(np.stack((tone, tone), axis=1), rate=src_rate))
+        
+        self.assertEqual(source.fs, SAMPLE_RATE)
+        self.assertEqual(source.data.dtype, np.float32)
+        self.assertAlmostEqual(len(source.data), SAMPLE_RATE, delta=1)
+        # The tone must keep its pitch after resampling (1 s of audio -> 1 Hz bins)
+        spectrum = np.abs(np.fft.rfft(source.data[:SAMPLE_RATE, 0]))
+        peak_hz = np.argmax(spectrum)
+        self.assertAlmostEqual(peak_hz, freq, delta=2)
+
+    def test_int16_is_scaled_before_resampling(self):
+        src_rate = 24000
+        t = np.arange(src_rate) / src_rate
+        tone = (16384 * np.sin(2 * np.pi * 500 * t)).astype(np.int16)
+        source = FileAudioSource(self._write_wav(tone, rate=src_rate))
+        self.assertEqual(source.data.dtype, np.float32)
+        # Half-scale int16 tone -> peak 0.5 after conversion (resampling keeps amplitude)
+        self.assertAlmostEqual(np.max(np.abs(source.data[1000:-1000])), 0.5, delta=0.01)
+
+    def test_resampled_audio_is_cached(self):
+        data = self._ramp(44100 // 2)
+        path = self._write_wav(data, rate=44100)
+        first = FileAudioSource(path)
+        self.assertEqual(len(list(self.cache_dir.glob("*.npy"))), 1)
+        
+        with mock.patch.object(file_source.signal, 'resample_poly') as resample:
+            second = FileAudioSource(path)
+        resample.assert_not_called()
+        self.assertEqual(second.fs, SAMPLE_RATE)
+        np.testing.assert_array_equal(second.data, first.data)
+
+    def test_native_rate_is_not_cached(self):
+        FileAudioSource(self._write_wav(self._ramp(CHUNK_SIZE)))
+        self.assertFalse(self.cache_dir.exists())
+
+if __name__ == '__main__':
+    unittest.main()
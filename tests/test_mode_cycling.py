@@ -0,0 +1,32 @@
+import os
+import unittest
+import pygame
+from src.render.pygame_render import PyGameRenderer
+
+class TestModeCycling(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.renderer = PyGameRenderer()
+
+    def _press_space(self):
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE))
+        self.renderer.update()
+
+    def test_spacebar_visits_every_combination_and_syncs_dropdown(self):
+        seen = []
+        for _ in range(len(PyGameRenderer.MODE_COMBINATIONS)):
+            self._press_space()
+            seen.append((self.renderer.base_mode, self.renderer.sub_mode))
+            option = self.renderer.dropdown.options[self.renderer.dropdown.selected_idx]
+            self.assertEqual(self.renderer.mode_map[option], self.renderer.base_mode)
+        self.assertCountEqual(seen, PyGameRenderer.MODE_COMBINATIONS)
+
+    def test_random_switch_syncs_dropdown(self):
+        for _ in range(20):
+            self.renderer._random_mode_switch()
+            option = self.renderer.dropdown.options[self.renderer.dropdown.selected_idx]
+            self.assertEqual(self.renderer.mode_map[option], self.renderer.base_mode)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import os
 import unittest
 import numpy as np
 import pygame
@@ -24,6 +25,27 @@ class TestOscilloscopeRender(unittest.TestCase):
         except Exception as e:
             self.fail(f"Oscilloscope rendering failed with unexpected error: {e}")
 
+    def test_trigger_finds_first_rising_crossing(self):
+        left = np.full(1024, 0.5, dtype=np.float32)
+        left[100:110] = -0.5   # falling at 99->100, rising at 109->110
+        left[300:310] = -0.5
+        self.assertEqual(self.renderer._find_trigger(left), 109)
+
+    def test_trigger_ignores_second_half(self):
+        left = np.full(1024, 0.5, dtype=np.float32)
+        left[700:710] = -0.5
+        self.assertEqual(self.renderer._find_trigger(left), 0)
+        # A crossing landing exactly on the half-way sample still counts
+        left[511] = -0.5
+        self.assertEqual(self.renderer._find_trigger(left), 511)
+
+    def test_cycle_mode_uses_last_two_crossings(self):
+        t = np.arange(1024)
+        chunk = np.zeros((1024, 2), dtype=np.float32)
+        chunk[:, 0] = np.sin(2 * np.pi * t / 100 + 0.1)  # Period of 100 samples
+        self.renderer._render_waveform_cycle(chunk)
+        self.assertEqual(len(self.renderer.cycle_history), 1)
+        self.assertEqual(len(self.renderer.cycle_history[0]), 100)
+
 if __name__ == '__main__':
-    import os
     unittest.main()
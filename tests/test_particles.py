@@ -0,0 +1,48 @@
+import os
+import unittest
+import numpy as np
+import pygame
+from src.render.pygame_render import ParticleSystem
+
+class TestParticleSystem(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.surface = pygame.Surface((800, 480))
+        self.particles = ParticleSystem(max_particles=8)
+
+    def test_draw_fades_color_with_age(self):
+        self.particles.spawn(100, 100, 0, 0, 3, (200, 100, 50), 1.0)
+        self.particles.update(dt=0.5)
+        self.particles.draw(self.surface)
+        self.assertEqual(tuple(self.surface.get_at((100, 100)))[:3], (100, 50, 25))
+
+    def test_off_screen_particles_are_not_drawn(self):
+        self.particles.spawn(-50, 100, 0, 0, 3, (255, 255, 255), 1.0)
+        self.particles.draw(self.surface)
+        self.assertEqual(pygame.transform.average_color(self.surface)[:3], (0, 0, 0))
+
+    def test_expired_particles_are_removed(self):
+        self.particles.spawn(10, 10, 0, 0, 1, (255, 0, 0), 0.1)
+        self.particles.spawn(20, 20, 0, 0, 1, (0, 255, 0), 1.0)
+        self.particles.update(dt=0.2)
+        self.assertEqual(self.particles.particle_count, 1)
+        # The survivor is packed into the first slot
+        self.assertEqual(tuple(self.particles.colors[0]), (0, 255, 0))
+
+    def test_spawn_stops_when_full(self):
+        for i in range(10):
+            self.particles.spawn(i, i, 0, 0, 1, (255, 0, 0), 1.0)
+        self.assertEqual(self.particles.particle_count, 8)
+
+    def test_spawn_batch_fills_free_slots_only(self):
+        self.particles.spawn(1, 1, 0, 0, 1, (255, 0, 0), 1.0)
+        count = 10
+        self.particles.spawn_batch(np.full((count, 2), 5.0), np.zeros((count, 2)),
+                                   np.ones(count), np.full((count, 3), 7), np.ones(count))
+        self.assertEqual(self.particles.particle_count, 8)
+        np.testing.assert_array_equal(self.particles.positions[1:8], 5.0)
+        self.assertEqual(tuple(self.particles.colors[0]), (255, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
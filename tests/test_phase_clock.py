@@ -0,0 +1,38 @@
+import os
+import unittest
+import numpy as np
+import pygame
+from src.render.pygame_render import PyGameRenderer
+from src.config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+class TestPhaseClockRender(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.renderer = PyGameRenderer()
+        self.renderer.mode = 'phase_clock'
+
+    def test_vectors_are_drawn_from_center(self):
+        spectrum = np.full((2, 1025), 0.5, dtype=np.float32)
+        phase = np.zeros((2, 1025), dtype=np.float32)
+        self.renderer.screen.fill((0, 0, 0))
+        self.renderer._render_phase_clock(spectrum, phase)
+        
+        pixels = pygame.surfarray.array3d(self.renderer.screen)
+        # Zero phase: bin 0 of the left channel points straight right of center
+        cx, cy = WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2
+        self.assertTrue(pixels[cx + 20, cy].any())
+        # Nothing is drawn beyond the maximum vector length
+        max_length = min(WINDOW_WIDTH, WINDOW_HEIGHT) // 2 - 30
+        self.assertFalse(pixels[cx + max_length + 5:, cy].any())
+
+    def test_silent_spectrum(self):
+        spectrum = np.zeros((2, 1025), dtype=np.float32)
+        phase = np.zeros((2, 1025), dtype=np.float32)
+        try:
+            self.renderer._render_phase_clock(spectrum, phase)
+        except Exception as e:
+            self.fail(f"Phase clock rendering failed on silence: {e}")
+
+if __name__ == '__main__':
+    unittest.main()
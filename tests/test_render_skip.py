@@ -0,0 +1,72 @@
+import os
+import unittest
+from unittest import mock
+import numpy as np
+import pygame
+from src.render.pygame_render import PyGameRenderer
+
+class TestRenderSkip(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.renderer = PyGameRenderer()
+        self.renderer.shuffle_enabled = False
+        self.spectrum = np.zeros((2, 1025), dtype=np.float32)
+        self.chunk = np.zeros((1024, 2), dtype=np.float32)
+
+    def _flips(self, frames):
+        with mock.patch('pygame.display.flip') as flip:
+            for _ in range(frames):
+                self.renderer.render(self.spectrum, self.chunk)
+        return flip.call_count
+
+    def test_static_mode_skips_repeated_frame(self):
+        self.renderer.mode = 'bars'
+        self.assertEqual(self._flips(3), 1)
+
+    def test_ui_event_forces_redraw(self):
+        self.renderer.mode = 'bars'
+        self._flips(1)
+        pygame.event.post(pygame.event.Event(pygame.MOUSEMOTION, pos=(5, 5), rel=(1, 1), buttons=(0, 0, 0)))
+        self.renderer.update()
+        self.assertEqual(self._flips(2), 1)
+
+    def _wave_frames(self, frames):
+        """Render frames in oscilloscope mode; return (flips, trace draws)."""
+        with mock.patch('pygame.display.flip') as flip, \
+                mock.patch('pygame.draw.lines', wraps=pygame.draw.lines) as lines:
+            for _ in range(frames):
+                self.renderer.render(self.spectrum, self.chunk)
+        return flip.call_count, lines.call_count
+
+    def test_fixed_scale_wave_skips_repeated_chunk(self):
+        self.renderer.mode = 'wave'
+        self.renderer.scale_multiplier = 1.0
+        self.chunk[:] = np.sin(np.linspace(0, 8 * np.pi, len(self.chunk)))[:, np.newaxis]
+        flips, traces = self._wave_frames(1)
+        self.assertEqual(flips, 1)
+        self.assertGreater(traces, 0)
+        # The same chunk again draws nothing and doesn't flip
+        self.assertEqual(self._wave_frames(2), (0, 0))
+        # A changed chunk is drawn
+        self.chunk[0, 0] = 0.5
+        flips, traces = self._wave_frames(1)
+        self.assertEqual(flips, 1)
+        self.assertGreater(traces, 0)
+
+    def test_adaptive_wave_always_redraws(self):
+        self.renderer.mode = 'wave'
+        self.renderer.scale_multiplier = None
+        self.chunk[:] = np.sin(np.linspace(0, 8 * np.pi, len(self.chunk)))[:, np.newaxis]
+        _, first_traces = self._wave_frames(1)
+        self.assertGreater(first_traces, 0)
+        flips, traces = self._wave_frames(2)
+        self.assertEqual(flips, 2)
+        self.assertEqual(traces, 2 * first_traces)
+
+    def test_animated_mode_always_redraws(self):
+        self.renderer.mode = 'spectrogram'
+        self.assertEqual(self._flips(3), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,4 @@
+import os
 import unittest
 import numpy as np
 import pygame
@@ -29,6 +30,54 @@ class TestSpectrogramRender(unittest.TestCase):
         except Exception as e:
             self.fail(f"Spectrogram rendering failed with unexpected error: {e}")
 
+    def test_log_lut_matches_log_mapping(self):
+        magnitudes = np.concatenate((
+            [0.0, 1e-6, 1e-3, 0.5, 1.0, 10.0, 1e6],
+            np.random.default_rng(0).random(10000) ** 3 * 12,
+        )).astype(np.float32)
+        exact = np.clip((np.log10(magnitudes.astype(np.float64) + 1e-6) + 3) / 4 * 255, 0, 255).astype(int)
+        levels = self.renderer._log_lut[magnitudes.view(np.uint32) >> 16]
+        self.assertEqual(levels.dtype, np.uint8)
+        # uint8 levels gather straight from the uint8 colormaps
+        self.assertEqual(self.renderer.colormap_left[levels].dtype, np.uint8)
+        self.assertLessEqual(np.abs(levels.astype(int) - exact).max(), 1)
+        # The fused table is the colormaps applied to those levels
+        np.testing.assert_array_equal(self.renderer._spec_color_lut[1][magnitudes.view(np.uint32) >> 16],
+                                      self.renderer.colormap_right[levels])
+
+    def test_index_cache_reused(self):
+        spectrum = np.random.rand(2, 1025)
+        self.renderer._render_spectrogram(spectrum)
+        cached = dict(self.renderer._idx_cache)
+        self.renderer._render_spectrogram(spectrum)
+        self.assertEqual(len(self.renderer._idx_cache), 1)
+        for key, indices in self.renderer._idx_cache.items():
+            self.assertIs(indices, cached[key])
+            self.assertEqual(len(indices), WINDOW_WIDTH // 2)
+
+    def test_new_row_written_at_bottom(self):
+        spectrum = np.zeros((2, 1025), dtype=np.float32)
+        spectrum[0] = 1.0  # Loud left channel, silent right channel
+        self.renderer._render_spectrogram(spectrum)
+        
+        pixels = pygame.surfarray.array3d(self.renderer.screen)[:WINDOW_WIDTH, :WINDOW_HEIGHT]
+        half_width = WINDOW_WIDTH // 2
+        bottom = pixels[:, WINDOW_HEIGHT - 1]
+        loud = self.renderer.colormap_left[self.renderer._log_lut[np.float32(1.0).view(np.uint32) >> 16]]
+        np.testing.assert_array_equal(bottom[:half_width], np.broadcast_to(loud, (half_width, 3)))
+        np.testing.assert_array_equal(bottom[half_width + 1:], np.broadcast_to(self.renderer.colormap_right[0], (WINDOW_WIDTH - half_width - 1, 3)))
+        # Separator column runs the full height, including the new row
+        np.testing.assert_array_equal(pixels[half_width], np.broadcast_to((50, 50, 50), (WINDOW_HEIGHT, 3)))
+
+    def test_rows_scroll_up_across_wraparound(self):
+        # Every frame gets a distinct level; after more frames than rows the
+        # screen must still show them oldest at the top, newest at the bottom
+        levels = np.geomspace(1e-3, 10, WINDOW_HEIGHT + 7).astype(np.float32)
+        for level in levels:
+            self.renderer._render_spectrogram(np.full((2, 1025), level, dtype=np.float32))
+        pixels = pygame.surfarray.array3d(self.renderer.screen)[:WINDOW_WIDTH, :WINDOW_HEIGHT]
+        expected = self.renderer.colormap_left[self.renderer._log_lut[levels[-WINDOW_HEIGHT:].view(np.uint32) >> 16]]
+        np.testing.assert_array_equal(pixels[0], expected)
+
 if __name__ == '__main__':
-    import os
     unittest.main()
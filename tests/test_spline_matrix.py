@@ -0,0 +1,43 @@
+import os
+import unittest
+import numpy as np
+import pygame
+from scipy.interpolate import make_interp_spline
+from src.render.pygame_render import PyGameRenderer
+
+class TestSplineMatrix(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.renderer = PyGameRenderer()
+
+    def test_matches_spline_fit(self):
+        x = np.linspace(0, 800, 256)
+        x_fine = np.linspace(0, 800, 300)
+        y = np.random.default_rng(0).uniform(0, 480, len(x))
+        spl_matrix = self.renderer._spline_matrix(('test', len(x)), x, x_fine)
+        expected = make_interp_spline(x, y, k=3)(x_fine)
+        np.testing.assert_allclose(spl_matrix @ y, expected, atol=1e-6)
+        # Cached for the next frame
+        self.assertIs(self.renderer._spline_matrix(('test', len(x)), x, x_fine), spl_matrix)
+
+    def test_periodic_matches_spline_fit(self):
+        angles = np.append(np.linspace(0, 2 * np.pi, 18, endpoint=False), 2 * np.pi)
+        angles_fine = np.linspace(0, 2 * np.pi, 180)
+        radii = np.random.default_rng(1).uniform(60, 220, 18)
+        spl_matrix = self.renderer._spline_matrix(('test_periodic', 18), angles,
+                                                  angles_fine, bc_type='periodic')
+        expected = make_interp_spline(angles, np.append(radii, radii[0]), k=3,
+                                      bc_type='periodic')(angles_fine)
+        self.assertEqual(spl_matrix.shape, (180, 18))
+        np.testing.assert_allclose(spl_matrix @ radii, expected, atol=1e-6)
+
+    def test_line_mode_draws_tiny_spectrum(self):
+        # 13 bins leave 3 points per channel: too few for the spline
+        spectrum = np.full((2, 13), 0.5, dtype=np.float32)
+        self.renderer.screen.fill((0, 0, 0))
+        self.renderer._render_line(spectrum)
+        self.assertTrue(pygame.surfarray.array3d(self.renderer.screen).any())
+
+if __name__ == '__main__':
+    unittest.main()
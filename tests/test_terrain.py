@@ -0,0 +1,29 @@
+import os
+import unittest
+import numpy as np
+import pygame
+from src.render.pygame_render import PyGameRenderer
+
+class TestTerrainHistory(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.renderer = PyGameRenderer()
+
+    def test_history_keeps_latest_frames_across_wraparound(self):
+        depth = self.renderer.terrain_history.shape[1]
+        frames = depth + 3
+        for k in range(frames):
+            spectrum = np.full((2, 1025), k, dtype=np.float32)
+            spectrum[1] += 0.5
+            self.renderer._render_spectral_terrain(spectrum)
+        self.assertEqual(self.renderer._terrain_rows, depth)
+        stored = self.renderer.terrain_history[:, :, 0]
+        np.testing.assert_array_equal(np.sort(stored[0]), np.arange(frames - depth, frames))
+        np.testing.assert_array_equal(stored[1] - stored[0], 0.5)
+        # The next write replaces the oldest stored frame
+        oldest = self.renderer._terrain_head
+        self.assertEqual(stored[0, oldest], frames - depth)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import unittest
+from unittest import mock
+import pygame
+from src.render.ui import Dropdown, ModeToggleButton
+
+class TestDropdown(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 480))
+        self.font = pygame.font.Font(None, 18)
+        self.options = ["Spectrum", "Radial", "Spectrogram"]
+        self.dropdown = Dropdown(590, 10, 200, 40, self.options, self.font)
+
+    def test_draw_does_not_rasterize_text(self):
+        font = mock.Mock(wraps=self.font)
+        dropdown = Dropdown(590, 10, 200, 40, self.options, font)
+        self.assertEqual(font.render.call_count, len(self.options))
+        font.reset_mock()
+        dropdown.is_open = True
+        for _ in range(3):
+            dropdown.draw(self.screen)
+        font.render.assert_not_called()
+
+    def test_button_follows_external_selection(self):
+        self.dropdown.draw(self.screen)
+        before = pygame.surfarray.array3d(self.screen.subsurface(self.dropdown.rect))
+        # The renderer sets selected_idx directly when cycling modes
+        self.dropdown.selected_idx = 2
+        self.dropdown.draw(self.screen)
+        after = pygame.surfarray.array3d(self.screen.subsurface(self.dropdown.rect))
+        self.assertTrue((before != after).any())
+
+    def test_open_list_drawn_once_per_state(self):
+        self.dropdown.is_open = True
+        with mock.patch('pygame.mouse.get_pos', return_value=(0, 0)):
+            self.dropdown.draw(self.screen)
+            with mock.patch('pygame.draw.rect') as draw_rect:
+                self.dropdown.draw(self.screen)
+            draw_rect.assert_not_called()
+        # Hovering another option draws that state once
+        option = self.dropdown._option_rects[1]
+        hover = (option.x + 3, option.y + 3)
+        with mock.patch('pygame.mouse.get_pos', return_value=hover):
+            with mock.patch('pygame.draw.rect', wraps=pygame.draw.rect) as draw_rect:
+                self.dropdown.draw(self.screen)
+            self.assertTrue(draw_rect.called)
+            self.assertEqual(self.screen.get_at(hover)[:3], self.dropdown.color_bg_hover)
+
+class TestModeToggleButton(unittest.TestCase):
+    def setUp(self):
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 480))
+        self.button = ModeToggleButton(765, 445, 25, pygame.font.Font(None, 18), current_mode='bars')
+
+    def test_each_state_drawn_once(self):
+        with mock.patch('pygame.mouse.get_pos', return_value=(0, 0)):
+            self.button.draw(self.screen)
+            with mock.patch('pygame.draw.circle') as draw_circle:
+                self.button.draw(self.screen)
+            draw_circle.assert_not_called()
+            # A new mode is a new state
+            self.button.set_mode('cycle')
+            with mock.patch('pygame.draw.circle', wraps=pygame.draw.circle) as draw_circle:
+                self.button.draw(self.screen)
+            self.assertTrue(draw_circle.called)
+
+if __name__ == '__main__':
+    unittest.main()